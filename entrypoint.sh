@@ -40,6 +40,14 @@ fi
 echo "🛠 Initializing database..."
 python -m peoples_coin.models.init_db --verbose
 
+# Per-worker Prometheus files must start empty, or stale processes' samples leak into /metrics
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+# The controller runs in one gunicorn worker (see gunicorn.conf.py), never in one-off commands
+export ENABLE_CONTROLLER="${ENABLE_CONTROLLER:-true}"
+
 echo "🚀 Starting Flask app..."
-exec gunicorn --bind 0.0.0.0:8080 "peoples_coin.factory:create_app()"
+exec gunicorn --bind 0.0.0.0:8080 --workers 2 --threads 8 --timeout 60 --preload wsgi:app
 
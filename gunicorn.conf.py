@@ -0,0 +1,54 @@
+"""
+Gunicorn server hooks for peoples-coin-service.
+
+Gunicorn loads this file from the working directory, so the Dockerfile and
+entrypoint.sh pick it up without extra flags.
+"""
+import atexit
+import fcntl
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Held by whichever worker runs the SystemController; the kernel releases it
+# when that worker exits, so its replacement takes over.
+CONTROLLER_LOCK_PATH = os.environ.get("CONTROLLER_LOCK_PATH", "/tmp/peoples_coin_controller.lock")
+_controller_lock = None
+
+
+def _acquire_controller_lock() -> bool:
+    global _controller_lock
+    lock_file = open(CONTROLLER_LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _controller_lock = lock_file
+    return True
+
+
+def post_fork(server, worker):
+    app = worker.app.wsgi()
+
+    # Every worker, including ones re-forked after a crash or timeout, drops the
+    # pool it inherited. close=False leaves the master's sockets alone and just
+    # makes this worker open its own connections.
+    from peoples_coin.extensions import db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+    # With --preload the app was built in the master; scheduler threads must be
+    # started here, in the worker, or they never run where requests are served.
+    if not app.config.get("ENABLE_CONTROLLER") or not _acquire_controller_lock():
+        return
+
+    from peoples_coin.extensions import redis_client
+    from peoples_coin.systems.system_controller import controller_system
+
+    controller_system.init_app(app, redis_instance=redis_client)
+    controller_system.start()
+    atexit.register(controller_system.stop)
+    logger.info("🧠 SystemController started in worker pid %s.", worker.pid)
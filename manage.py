@@ -1,13 +1,7 @@
-import os
-import sys
 from flask.cli import FlaskGroup
 from flask_migrate import Migrate
 
-# This line adds your 'src' folder to the Python path
-# so it can find your 'peoples_coin' code.
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
-
-# Now we can import your app from the peoples_coin module
+# peoples_coin lives next to this script, which Python already puts on sys.path.
 from peoples_coin import create_app, db
 
 app = create_app()
@@ -7,10 +7,11 @@ without modifying any data or triggering controller actions.
 All endpoints are GET-only and designed for safe monitoring.
 """
 import os
+import json
 import logging
 from datetime import datetime, timezone
-from flask import Flask, jsonify, request
-from sqlalchemy import text
+from flask import Flask, Response, jsonify, request
+from sqlalchemy import func, select, text
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -84,15 +85,22 @@ def create_observability_app(db_uri=None, redis_url=None):
     # Store startup time for uptime calculation
     app.startup_time = datetime.now(timezone.utc)
     
+    # The rejection body never changes, so serialize it once at startup
+    method_not_allowed_body = json.dumps({
+        "error": "Method Not Allowed",
+        "message": "This observability node is read-only. Only GET requests are accepted."
+    }).encode()
+
     # Middleware to reject non-GET requests
     @app.before_request
     def reject_non_get_requests():
         """Reject all non-GET requests with 405 Method Not Allowed."""
         if request.method != 'GET':
-            return jsonify({
-                "error": "Method Not Allowed",
-                "message": "This observability node is read-only. Only GET requests are accepted."
-            }), 405
+            return Response(
+                method_not_allowed_body,
+                status=405,
+                mimetype="application/json"
+            )
     
     # Endpoint 1: Health check
     @app.route('/health', methods=['GET'])
@@ -224,21 +232,27 @@ def create_observability_app(db_uri=None, redis_url=None):
                 from peoples_coin.models.vote import Vote
                 from peoples_coin.models.council_member import CouncilMember
                 
-                # Count proposals by status
-                proposal_counts = {}
-                for status in ['DRAFT', 'ACTIVE', 'CLOSED', 'REJECTED']:
-                    count = db.session.query(Proposal).filter(
-                        Proposal.status == status
-                    ).count()
-                    proposal_counts[status.lower()] = count
-                
-                # Count total votes
-                total_votes = db.session.query(Vote).count()
-                
-                # Count active council members
-                active_council_members = db.session.query(CouncilMember).filter(
-                    CouncilMember.end_date.is_(None)
-                ).count()
+                # Proposal counts by status, total votes and active council
+                # members in a single round-trip: one conditional aggregate
+                # per status plus two scalar subqueries.
+                statuses = ['DRAFT', 'ACTIVE', 'CLOSED', 'REJECTED']
+                summary = db.session.query(
+                    *[
+                        func.count().filter(Proposal.status == status)
+                        for status in statuses
+                    ],
+                    select(func.count()).select_from(Vote).scalar_subquery(),
+                    select(func.count()).select_from(CouncilMember).where(
+                        CouncilMember.end_date.is_(None)
+                    ).scalar_subquery(),
+                ).select_from(Proposal).one()
+
+                proposal_counts = {
+                    status.lower(): count
+                    for status, count in zip(statuses, summary)
+                }
+                total_votes = summary[len(statuses)]
+                active_council_members = summary[len(statuses) + 1]
                 
                 # Get recent proposals (last 5)
                 recent_proposals = db.session.query(Proposal).order_by(
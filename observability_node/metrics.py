@@ -5,6 +5,7 @@ This module provides functions to safely collect system metrics
 including CPU, memory, disk, and database statistics.
 """
 import os
+import time
 import psutil
 import logging
 from datetime import datetime, timezone
@@ -12,6 +13,22 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Disk usage changes slowly, so re-stat the filesystem at most this often
+DISK_USAGE_TTL_SECONDS = 300
+_disk_cache: Dict[str, Any] = {"checked_at": 0.0, "usage": None}
+
+# Prime psutil's CPU counters so the first non-blocking sample is meaningful
+psutil.cpu_percent(interval=None)
+
+
+def _get_disk_usage():
+    """Return psutil.disk_usage('/'), refreshed at most every DISK_USAGE_TTL_SECONDS."""
+    now = time.monotonic()
+    if _disk_cache["usage"] is None or now - _disk_cache["checked_at"] > DISK_USAGE_TTL_SECONDS:
+        _disk_cache["usage"] = psutil.disk_usage('/')
+        _disk_cache["checked_at"] = now
+    return _disk_cache["usage"]
+
 
 def get_system_metrics() -> Dict[str, Any]:
     """
@@ -21,9 +38,10 @@ def get_system_metrics() -> Dict[str, Any]:
         dict: System metrics including CPU, memory, disk, and load averages
     """
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Non-blocking: CPU usage since the previous call instead of sleeping 1s
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        disk = _get_disk_usage()
         
         # Load averages (1, 5, 15 minutes) - Unix only
         try:
@@ -27,7 +27,7 @@ def _run_ai_simulation(action: GoodwillAction) -> Dict[str, float]:
     This function is a placeholder for your actual, potentially long-running,
     computational models. It returns a dictionary of calculated metrics.
     """
-    logger.debug(f"Running AI simulation for action type: {action.action_type}")
+    logger.debug("Running AI simulation for action type: %s", action.action_type)
     time.sleep(random.uniform(1, 3)) # Simulate blocking work of a real model
 
     # TODO: Replace these random values with results from your actual models
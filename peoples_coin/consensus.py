@@ -17,6 +17,7 @@ from peoples_coin.validate.validate_transaction import validate_transaction
 
 logger = logging.getLogger(__name__)
 TRANSACTION_POOL_KEY = "consensus:transaction_pool"
+NODES_KEY = "consensus:nodes"
 
 
 def sha256(data: bytes) -> str:
@@ -40,7 +41,6 @@ class Consensus:
     """Manages the blockchain, transaction pool, and node synchronization."""
 
     def __init__(self):
-        self.nodes: Set[str] = set()
         self.app = None
         self.db = None
         self.redis: Optional[Redis] = None
@@ -60,6 +60,7 @@ class Consensus:
         self.redis = redis_instance
         if not self.redis:
             raise RuntimeError("Redis is required for the Consensus transaction pool.")
+        app.extensions["consensus"] = self
         self.create_genesis_block_if_needed()
         logger.info("🚀 Consensus initialized.")
 
@@ -79,18 +80,42 @@ class Consensus:
             else:
                 logger.info("Genesis block already exists.")
 
-    def add_transaction(self, transaction: Dict[str, Any]) -> int:
+    def register_node(self, address: str) -> None:
         """
-        Adds a transaction to the shared transaction pool in Redis.
-        Returns the anticipated block number for this transaction.
+        Registers a peer node address.
+        The registry is a Redis set, so every worker and instance sees the same peers.
         """
+        if self.redis.sadd(NODES_KEY, address):
+            logger.info("🌐 Registered peer node %s.", address)
+        else:
+            logger.info("🌐 Peer node %s was already registered.", address)
+
+    @property
+    def nodes(self) -> Set[str]:
+        """All registered peer node addresses."""
+        return {n.decode() if isinstance(n, bytes) else n for n in self.redis.smembers(NODES_KEY)}
+
+    def next_block_number(self, session) -> int:
+        """Returns the height the next block will have, read within the given session."""
+        last_block_number = session.query(ChainBlock.height).order_by(ChainBlock.height.desc()).scalar()
+        return (last_block_number + 1) if last_block_number is not None else 0
+
+    def queue_transaction(self, transaction: Dict[str, Any]) -> None:
+        """Pushes a transaction onto the shared transaction pool in Redis."""
         self.redis.rpush(TRANSACTION_POOL_KEY, json.dumps(transaction))
         pool_size = self.redis.llen(TRANSACTION_POOL_KEY)
-        logger.info(f"➕ Transaction added to Redis pool (pool size: {pool_size}).")
+        logger.info("➕ Transaction added to Redis pool (pool size: %d).", pool_size)
 
+    def add_transaction(self, transaction: Dict[str, Any]) -> int:
+        """
+        Adds a transaction to the shared transaction pool in Redis.
+        Returns the anticipated block number for this transaction.
+        This opens and commits its own session scope; callers already inside a
+        transaction should use next_block_number() and queue_transaction().
+        """
+        self.queue_transaction(transaction)
         with get_session_scope(self.db) as session:
-            last_block_number = session.query(ChainBlock.height).order_by(ChainBlock.height.desc()).scalar()
-            return (last_block_number + 1) if last_block_number is not None else 0
+            return self.next_block_number(session)
 
     def calculate_block_hash(self, block_data: Dict[str, Any], transactions: List[Dict[str, Any]]) -> str:
         """
@@ -3,7 +3,6 @@ from flask_migrate import Migrate
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from flasgger import Swagger
 from celery import Celery
 from flask_redis import FlaskRedis  # <<-- THIS IS THE MISSING IMPORT
 
@@ -11,7 +10,6 @@ from flask_redis import FlaskRedis  # <<-- THIS IS THE MISSING IMPORT
 db = SQLAlchemy()
 migrate = Migrate()
 cors = CORS()
-swagger = Swagger()
 limiter = Limiter(key_func=get_remote_address)
 celery = Celery(__name__)
 redis_client = FlaskRedis()
@@ -1,4 +1,5 @@
 import os
+import atexit
 import logging
 from flask import Flask
 
@@ -9,7 +10,6 @@ from peoples_coin.extensions import (
     migrate,
     cors,
     limiter,
-    swagger,
     make_celery,
     redis_client  # Redis client imported here
 )
@@ -19,6 +19,8 @@ from peoples_coin.systems.cognitive_system import cognitive_system
 from peoples_coin.systems.endocrine_system import endocrine_system
 from peoples_coin.systems.circulatory_system import circulatory_system
 from peoples_coin.consensus import Consensus
+from peoples_coin.utils.metrics import init_metrics
+from peoples_coin.utils.recaptcha import RECAPTCHA_CONFIGURED
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -72,23 +74,40 @@ def create_app():
             SECRET_KEY=secret_key,
             SQLALCHEMY_DATABASE_URI=db_uri,
             SQLALCHEMY_TRACK_MODIFICATIONS=False,
+            # Validate pooled connections before use and recycle them before
+            # Cloud SQL / Postgres idle timeouts can close them underneath us.
+            SQLALCHEMY_ENGINE_OPTIONS={
+                "pool_pre_ping": True,
+                "pool_recycle": 300,
+            },
             CELERY_BROKER_URL=os.environ.get("CELERY_BROKER_URL"),
             CELERY_RESULT_BACKEND=os.environ.get("CELERY_RESULT_BACKEND"),
             RECAPTCHA_SECRET_KEY=os.environ.get("RECAPTCHA_SECRET_KEY"),
             # Redis client URL — reuse Celery broker URL env var
-            REDIS_URL=os.environ.get("CELERY_BROKER_URL")
+            REDIS_URL=os.environ.get("CELERY_BROKER_URL"),
+            # Swagger UI pulls in flasgger (jsonschema, yaml); opt out in production workers
+            ENABLE_SWAGGER=os.environ.get("ENABLE_SWAGGER", "true").lower() == "true",
+            # Periodic backlog analysis; started by gunicorn.conf.py in one server worker
+            ENABLE_CONTROLLER=os.environ.get("ENABLE_CONTROLLER", "false").lower() == "true",
+            # Oversized bodies are rejected with 413 before any JSON parsing.
+            MAX_CONTENT_LENGTH=int(os.environ.get("MAX_CONTENT_LENGTH", 1024 * 1024)),
         )
 
     except Exception as e:
         logger.critical(f"🚨 FAILED TO CONFIGURE DATABASE: {e}")
         raise
 
+    if not RECAPTCHA_CONFIGURED:
+        logger.warning("⚠️ reCAPTCHA environment variables are not set; verification will fail.")
+
     # Initialize Flask extensions
     db.init_app(app)
     migrate.init_app(app, db)
     cors.init_app(app)
     limiter.init_app(app)
-    swagger.init_app(app)
+    if app.config["ENABLE_SWAGGER"]:
+        from flasgger import Swagger
+        Swagger(app)
     redis_client.init_app(app)  # Redis client init here
     logger.info("✅ Core Flask extensions initialized.")
 
@@ -115,8 +134,16 @@ def create_app():
         endocrine_system.start()
         logger.info("✅ All custom system background threads started.")
 
+        # Stop the background threads on interpreter exit instead of installing
+        # signal handlers, so Gunicorn's own SIGTERM handling stays in charge.
+        # atexit runs LIFO, so these stop in reverse start order.
+        atexit.register(immune_system.stop)
+        atexit.register(cognitive_system.stop)
+        atexit.register(endocrine_system.stop)
+
     # Register blueprints
     register_routes(app)
+    init_metrics(app)
     logger.info("✅ Blueprints registered successfully.")
 
     # Health check endpoint
@@ -0,0 +1,37 @@
+"""Add timestamp indexes for recent-first controller and audit reads
+
+Revision ID: 5f3a9c2d7e41
+Revises: 2c14a2dde935
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3a9c2d7e41'
+down_revision: Union[str, None] = '2c14a2dde935'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Neither table is created by this migration chain (they come from schema.sql
+    # / create_all, whose model Index entries already cover these indexes), so only
+    # index the tables that exist.
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('controller_actions'):
+        op.create_index('idx_controller_actions_timestamp', 'controller_actions', ['timestamp'], unique=False, if_not_exists=True)
+    if inspector.has_table('audit_log'):
+        op.create_index('idx_audit_log_created_at', 'audit_log', ['created_at'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('audit_log'):
+        op.drop_index('idx_audit_log_created_at', table_name='audit_log', if_exists=True)
+    if inspector.has_table('controller_actions'):
+        op.drop_index('idx_controller_actions_timestamp', table_name='controller_actions', if_exists=True)
@@ -2,7 +2,7 @@
 
 import uuid
 from sqlalchemy import (
-    Column, String, DateTime, func, ForeignKey
+    Column, String, DateTime, func, ForeignKey, Index
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, ENUM, JSONB
@@ -27,6 +27,11 @@ class AuditLog(db.Model):
     # Relationship to link back to the UserAccount model
     actor = relationship("UserAccount", back_populates="audit_logs")
 
+    # Supports the "most recent entries" ORDER BY created_at DESC LIMIT n reads
+    __table_args__ = (
+        Index("idx_audit_log_created_at", "created_at"),
+    )
+
     def to_dict(self):
         """Serializes the AuditLog object to a dictionary."""
         return {
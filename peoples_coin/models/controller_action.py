@@ -1,7 +1,7 @@
 # peoples_coin/models/controller_action.py
 
 from sqlalchemy import (
-    Column, Integer, DateTime, func, ForeignKey
+    Column, Integer, DateTime, func, ForeignKey, Index
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
@@ -21,6 +21,11 @@ class ControllerAction(db.Model):
     # Relationship to link back to the UserAccount model
     user_account = relationship("UserAccount", back_populates="controller_actions")
 
+    # Supports the "most recent decisions" ORDER BY timestamp DESC LIMIT n reads
+    __table_args__ = (
+        Index("idx_controller_actions_timestamp", "timestamp"),
+    )
+
     def to_dict(self):
         """Serializes the ControllerAction object to a dictionary."""
         return {
@@ -27,18 +27,18 @@ def get_session_scope(db_instance=None):  # <<-- FIX: Added optional db_instance
         yield session
         session.commit()
     except (OperationalError, SQLAlchemyError) as e:
-        logger.error(f"Database error during scoped session: {e}", exc_info=True)
+        logger.error("Database error during scoped session: %s", e, exc_info=True)
         session.rollback()
         raise
     except Exception as e:
-        logger.error(f"Unexpected error during scoped session: {e}", exc_info=True)
+        logger.error("Unexpected error during scoped session: %s", e, exc_info=True)
         session.rollback()
         raise
     finally:
         try:
             session.close()
         except Exception as e:
-            logger.error(f"Error closing session: {e}", exc_info=True)
+            logger.error("Error closing session: %s", e, exc_info=True)
 
 
 def retry_db_operation(func, retries=3, delay=2, *args, **kwargs):
@@ -51,13 +51,13 @@ def retry_db_operation(func, retries=3, delay=2, *args, **kwargs):
             return func(*args, **kwargs)
         except (OperationalError, SQLAlchemyError) as e:
             if attempt == retries:
-                logger.error(f"DB operation failed after {retries} retries: {e}", exc_info=True)
+                logger.error("DB operation failed after %d retries: %s", retries, e, exc_info=True)
                 raise
-            logger.warning(f"DB operation failed (attempt {attempt+1}/{retries}): {e} — retrying in {delay}s...")
+            logger.warning("DB operation failed (attempt %d/%d): %s — retrying in %ss...", attempt + 1, retries, e, delay)
             attempt += 1
             time.sleep(delay)
         except Exception as e:
-            logger.error(f"Unexpected error during DB operation: {e}", exc_info=True)
+            logger.error("Unexpected error during DB operation: %s", e, exc_info=True)
             raise
 
 
@@ -92,7 +92,7 @@ def rollback_session(session=None):
     try:
         session.rollback()
     except Exception as e:
-        logger.error(f"Failed to rollback session: {e}", exc_info=True)
+        logger.error("Failed to rollback session: %s", e, exc_info=True)
 
 
 def close_session(session=None):
@@ -103,4 +103,4 @@ def close_session(session=None):
     try:
         session.close()
     except Exception as e:
-        logger.error(f"Failed to close session: {e}", exc_info=True)
+        logger.error("Failed to close session: %s", e, exc_info=True)
@@ -20,7 +20,11 @@ class GoodwillAction(db.Model):
     loves_value = Column(Integer, nullable=False, default=0)
     
     status = Column(
-        ENUM('PENDING_VERIFICATION', 'VERIFIED', 'REJECTED', name='goodwill_status', create_type=False),
+        ENUM(
+            'PENDING_VERIFICATION', 'VERIFIED', 'REJECTED',
+            'ISSUED_ON_CHAIN', 'FAILED_USER_NOT_FOUND', 'FAILED_WALLET_MISSING',
+            name='goodwill_status', create_type=False,
+        ),
         nullable=False,
         server_default='PENDING_VERIFICATION'
     )
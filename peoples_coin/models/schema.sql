@@ -12,8 +12,15 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 --------------------------------------------------------------------------------
 
 DO $$ BEGIN
-    CREATE TYPE goodwill_status AS ENUM ('PENDING_VERIFICATION', 'VERIFIED', 'REJECTED');
+    CREATE TYPE goodwill_status AS ENUM (
+        'PENDING_VERIFICATION', 'VERIFIED', 'REJECTED',
+        'ISSUED_ON_CHAIN', 'FAILED_USER_NOT_FOUND', 'FAILED_WALLET_MISSING'
+    );
 EXCEPTION WHEN duplicate_object THEN null; END $$;
+-- Minting statuses, for databases created before they were added.
+ALTER TYPE goodwill_status ADD VALUE IF NOT EXISTS 'ISSUED_ON_CHAIN';
+ALTER TYPE goodwill_status ADD VALUE IF NOT EXISTS 'FAILED_USER_NOT_FOUND';
+ALTER TYPE goodwill_status ADD VALUE IF NOT EXISTS 'FAILED_WALLET_MISSING';
 
 DO $$ BEGIN
     CREATE TYPE proposal_status AS ENUM ('DRAFT', 'ACTIVE', 'CLOSED', 'REJECTED');
@@ -391,6 +398,7 @@ CREATE TABLE IF NOT EXISTS audit_log (
 );
 CREATE INDEX IF NOT EXISTS idx_audit_log_actor_user_id ON audit_log(actor_user_id);
 CREATE INDEX IF NOT EXISTS idx_audit_log_action_type ON audit_log(action_type);
+CREATE INDEX IF NOT EXISTS idx_audit_log_created_at ON audit_log(created_at);
 
 CREATE TABLE IF NOT EXISTS content_reports (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
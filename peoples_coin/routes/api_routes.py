@@ -35,7 +35,7 @@ class UserCreateSchema(BaseModel):
 
 @user_api_bp.route("/users/check-username/<username>", methods=["GET"])
 def username_check(username):
-    logger.info(f"Checking availability for username: {username}")
+    logger.info("Checking availability for username: %s", username)
     try:
         with get_session_scope() as session:
             user_exists = session.query(UserAccount).filter(
@@ -46,7 +46,7 @@ def username_check(username):
             return jsonify(available=is_available), http.HTTPStatus.OK
 
     except Exception as e:
-        logger.error(f"Error checking username '{username}': {e}", exc_info=True)
+        logger.error("Error checking username '%s': %s", username, e, exc_info=True)
         return jsonify(error="An internal server error occurred."), http.HTTPStatus.INTERNAL_SERVER_ERROR
 
 
@@ -75,7 +75,7 @@ def delete_user_account():
     try:
         # 1. Delete user from Firebase
         firebase_auth.delete_user(firebase_user.firebase_uid)
-        logger.info(f"Deleted user from Firebase: {firebase_user.firebase_uid}")
+        logger.info("Deleted user from Firebase: %s", firebase_user.firebase_uid)
 
         # 2. Delete user and their wallets from our database
         with get_session_scope() as session:
@@ -87,12 +87,12 @@ def delete_user_account():
                 session.query(UserWallet).filter(UserWallet.user_id == db_user.id).delete()
                 session.query(UserAccount).filter(UserAccount.id == db_user.id).delete()
                 session.commit()
-                logger.info(f"Deleted user from database: {db_user.username}")
+                logger.info("Deleted user from database: %s", db_user.username)
 
         return jsonify(message="Account deleted successfully."), http.HTTPStatus.OK
 
     except Exception as e:
-        logger.error(f"Error during account deletion: {e}", exc_info=True)
+        logger.error("Error during account deletion: %s", e, exc_info=True)
         return jsonify(error="An internal server error occurred."), http.HTTPStatus.INTERNAL_SERVER_ERROR
 
 
@@ -100,7 +100,7 @@ def delete_user_account():
 @require_firebase_token
 def create_user_and_wallet():
     firebase_user = g.user  # g.user is the FirebaseUser object set by @require_firebase_token
-    logger.info(f"Creating user and wallet for Firebase UID: {firebase_user.firebase_uid}")
+    logger.info("Creating user and wallet for Firebase UID: %s", firebase_user.firebase_uid)
 
     try:
         payload = request.get_json()
@@ -117,7 +117,7 @@ def create_user_and_wallet():
 
         valid, message = verify_recaptcha(
             token=recaptcha_token,
-            action="create_user_and_wallet",
+            expected_action="create_user_and_wallet",
             user_ip=user_ip,
             user_agent=user_agent,
         )
@@ -176,18 +176,18 @@ def create_user_and_wallet():
             session.add(new_wallet)
             session.commit()
 
-            logger.info(f"User '{validated_data.username}' registered successfully with ID: {new_user.id}")
+            logger.info("User '%s' registered successfully with ID: %s", validated_data.username, new_user.id)
             return jsonify({
                 "message": "User and wallet created successfully",
                 "userId": str(new_user.id)
             }), http.HTTPStatus.CREATED
 
     except ValidationError as ve:
-        logger.warning(f"Validation failed: {ve.errors()}")
+        logger.warning("Validation failed: %s", ve.errors())
         return jsonify(error="Invalid input", details=ve.errors()), http.HTTPStatus.UNPROCESSABLE_ENTITY
 
     except IntegrityError as e:
-        logger.warning(f"Integrity error (duplicate): {e}")
+        logger.warning("Integrity error (duplicate): %s", e)
         # This is your safety net if the check above fails due to a race condition.
         # It's good practice to check the error content to be more specific.
         if 'username' in str(e.orig).lower():
@@ -195,7 +195,7 @@ def create_user_and_wallet():
         return jsonify(error="A user with these details already exists."), http.HTTPStatus.CONFLICT
 
     except Exception as e:
-        logger.error(f"Unexpected error during registration: {e}", exc_info=True)
+        logger.error("Unexpected error during registration: %s", e, exc_info=True)
         return jsonify(error="An internal server error occurred."), http.HTTPStatus.INTERNAL_SERVER_ERROR
 
 # This can be a simplified alias
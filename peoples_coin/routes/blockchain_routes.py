@@ -1,5 +1,5 @@
 import http
-from flask import Blueprint, request, jsonify, current_app, g
+from flask import Blueprint, request, jsonify, current_app
 from pydantic import BaseModel, Field, HttpUrl, ValidationError
 
 from sqlalchemy import func
@@ -87,7 +87,7 @@ def register_node():
     Register a new peer node.
     Expects JSON body with 'address' field validated via Pydantic.
     """
-    validated_data: RegisterNodeSchema = g.validated_data
+    validated_data: RegisterNodeSchema = request.validated_data
 
     consensus = current_app.extensions.get('consensus')
     if not consensus:
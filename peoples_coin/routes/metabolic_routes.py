@@ -25,7 +25,9 @@ metabolic_bp = Blueprint('metabolic', __name__, url_prefix='/metabolic')
 @metabolic_bp.before_request
 def extract_correlation_id() -> None:
     """Ensures a correlation ID is present for every request for tracing."""
-    g.correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+    # Only mint an ID when the client didn't send one; the default argument of
+    # headers.get() would otherwise generate a UUID on every request.
+    g.correlation_id = request.environ.get("HTTP_X_CORRELATION_ID") or uuid.uuid4().hex
 
 
 def log_with_correlation(level: str, message: str, **kwargs) -> None:
@@ -48,7 +48,7 @@ class GoodwillService:
         # Validate incoming data
         validation_result = validate_transaction(data)
         if not validation_result.is_valid:
-            logger.warning(f"Validation failed: {validation_result.errors}")
+            logger.warning("Validation failed: %s", validation_result.errors)
             raise GoodwillError(f"Validation failed: {validation_result.errors}")
 
         validated_data = validation_result.data
@@ -58,7 +58,7 @@ class GoodwillService:
                 # Link Firebase UID to internal UserAccount UUID
                 user_account = session.query(UserAccount).filter_by(firebase_uid=validated_data['user_id']).first()
                 if not user_account:
-                    logger.warning(f"UserAccount not found for Firebase UID: {validated_data['user_id']}")
+                    logger.warning("UserAccount not found for Firebase UID: %s", validated_data['user_id'])
                     raise GoodwillError(f"No UserAccount found for Firebase UID {validated_data['user_id']}")
 
                 goodwill_action = GoodwillAction(
@@ -73,7 +73,7 @@ class GoodwillService:
                 session.add(goodwill_action)
                 session.flush()  # Assign ID
 
-                logger.info(f"GoodwillAction {goodwill_action.id} persisted. Queueing for blockchain minting.")
+                logger.info("GoodwillAction %s persisted. Queueing for blockchain minting.", goodwill_action.id)
 
                 if self.message_queue_client:
                     # Placeholder for queueing logic — implement your message broker here
@@ -83,7 +83,7 @@ class GoodwillService:
                     #     self.app.config['MINTING_TOPIC_ID']
                     # )
                     # self.message_queue_client.publisher.publish(topic_path, str(goodwill_action.id).encode('utf-8'))
-                    logger.info(f"Queued GoodwillAction ID {goodwill_action.id} for blockchain processing.")
+                    logger.info("Queued GoodwillAction ID %s for blockchain processing.", goodwill_action.id)
                 else:
                     logger.warning("Message queue client not initialized; skipping queuing.")
 
@@ -17,6 +17,9 @@ logger = logging.getLogger(__name__)
 # Set a safe precision for Decimal operations (adjust as needed)
 getcontext().prec = 28
 
+# Shared zero for vote tallies (Decimal is immutable).
+_ZERO = Decimal('0.0')
+
 STATUS_PROPOSAL_DRAFT = 'DRAFT'
 STATUS_PROPOSAL_VOTING = 'VOTING'
 STATUS_PROPOSAL_PASSED = 'PASSED'
@@ -265,13 +268,13 @@ class GovernanceService:
             if proposal.vote_end_time and now < proposal.vote_end_time:
                 return False, "Voting period has not ended."
 
-            # Sum actual vote power per choice; coalesce to Decimal('0.0')
-            total_yes = session.query(func.coalesce(func.sum(Vote.actual_vote_power), Decimal('0.0'))).filter_by(
-                proposal_id=proposal.id, vote_value=VOTE_CHOICE_YES).scalar() or Decimal('0.0')
-            total_no = session.query(func.coalesce(func.sum(Vote.actual_vote_power), Decimal('0.0'))).filter_by(
-                proposal_id=proposal.id, vote_value=VOTE_CHOICE_NO).scalar() or Decimal('0.0')
-            total_abstain = session.query(func.coalesce(func.sum(Vote.actual_vote_power), Decimal('0.0'))).filter_by(
-                proposal_id=proposal.id, vote_value=VOTE_CHOICE_ABSTAIN).scalar() or Decimal('0.0')
+            # Sum actual vote power per choice; coalesce to zero
+            total_yes = session.query(func.coalesce(func.sum(Vote.actual_vote_power), _ZERO)).filter_by(
+                proposal_id=proposal.id, vote_value=VOTE_CHOICE_YES).scalar() or _ZERO
+            total_no = session.query(func.coalesce(func.sum(Vote.actual_vote_power), _ZERO)).filter_by(
+                proposal_id=proposal.id, vote_value=VOTE_CHOICE_NO).scalar() or _ZERO
+            total_abstain = session.query(func.coalesce(func.sum(Vote.actual_vote_power), _ZERO)).filter_by(
+                proposal_id=proposal.id, vote_value=VOTE_CHOICE_ABSTAIN).scalar() or _ZERO
 
             total_votes = total_yes + total_no + total_abstain
 
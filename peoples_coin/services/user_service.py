@@ -61,7 +61,7 @@ class UserService:
         with get_session_scope(self.db) as session:
             existing_user = session.query(UserAccount).filter_by(firebase_uid=firebase_uid).first()
             if existing_user:
-                logger.debug(f"UserService: Existing UserAccount found for Firebase UID {firebase_uid}.")
+                logger.debug("UserService: Existing UserAccount found for Firebase UID %s.", firebase_uid)
                 return existing_user, False
             try:
                 new_user = UserAccount(
@@ -9,7 +9,7 @@ from decimal import Decimal
 from typing import Tuple, Optional
 
 from flask import Flask
-from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy import update
 
 from peoples_coin.utils.auth import require_api_key
 from peoples_coin.models.db_utils import get_session_scope
@@ -55,63 +55,95 @@ class CirculatorySystem:
 
         with get_session_scope(self.db) as session:
             try:
-                goodwill_action = session.query(GoodwillAction).with_for_update().filter_by(id=goodwill_action_id).one()
-
-                if goodwill_action.status == 'ISSUED_ON_CHAIN':
-                    msg = f"Skipped: GoodwillAction {goodwill_action_id} already issued on-chain."
-                    return True, msg, http.HTTPStatus.OK
-
-                if goodwill_action.status != 'VERIFIED':
-                    msg = f"Skipped: GoodwillAction {goodwill_action_id} status is '{goodwill_action.status}', not 'VERIFIED'."
-                    return False, msg, http.HTTPStatus.UNPROCESSABLE_ENTITY
-
-                user_account = session.query(UserAccount).filter_by(id=goodwill_action.performer_user_id).first()
-                if not user_account:
-                    msg = f"Minting failed: UserAccount not found for performer ID {goodwill_action.performer_user_id}."
-                    goodwill_action.status = 'FAILED_USER_NOT_FOUND'
+                # Claim the action with one conditional UPDATE; the WHERE clause makes minting
+                # idempotent without a SELECT ... FOR UPDATE round trip.
+                claimed = session.execute(
+                    update(GoodwillAction)
+                    .where(GoodwillAction.id == goodwill_action_id, GoodwillAction.status == 'VERIFIED')
+                    .values(status='ISSUED_ON_CHAIN')
+                    .returning(GoodwillAction.performer_user_id, GoodwillAction.loves_value)
+                    .execution_options(synchronize_session=False)
+                ).first()
+
+                if claimed is None:
+                    status = session.query(GoodwillAction.status).filter_by(id=goodwill_action_id).scalar()
+                    if status is None:
+                        msg = f"Minting failed: GoodwillAction ID {goodwill_action_id} not found."
+                        return False, msg, http.HTTPStatus.NOT_FOUND
+                    if status == 'ISSUED_ON_CHAIN':
+                        msg = f"Skipped: GoodwillAction {goodwill_action_id} already issued on-chain."
+                        return True, msg, http.HTTPStatus.OK
+                    msg = f"Skipped: GoodwillAction {goodwill_action_id} status is '{status}', not 'VERIFIED'."
                     return False, msg, http.HTTPStatus.UNPROCESSABLE_ENTITY
 
-                user_wallet = session.query(UserWallet).filter_by(user_id=user_account.id, is_primary=True).first()
-                if not user_wallet:
-                    msg = f"Minting failed: No primary wallet found for user ID {user_account.id}."
-                    goodwill_action.status = 'FAILED_WALLET_MISSING'
+                performer_id, loves_value = claimed
+                receiver_address = session.query(UserWallet.public_address).filter_by(
+                    user_id=performer_id, is_primary=True
+                ).scalar()
+                if receiver_address is None:
+                    # Only distinguish the two failure modes on the (rare) miss path.
+                    if session.query(UserAccount.id).filter_by(id=performer_id).first() is None:
+                        msg = f"Minting failed: UserAccount not found for performer ID {performer_id}."
+                        failed_status = 'FAILED_USER_NOT_FOUND'
+                    else:
+                        msg = f"Minting failed: No primary wallet found for user ID {performer_id}."
+                        failed_status = 'FAILED_WALLET_MISSING'
+                    session.execute(
+                        update(GoodwillAction)
+                        .where(GoodwillAction.id == goodwill_action_id)
+                        .values(status=failed_status)
+                        .execution_options(synchronize_session=False)
+                    )
                     return False, msg, http.HTTPStatus.UNPROCESSABLE_ENTITY
 
-                loves_to_mint = Decimal(goodwill_action.loves_value)
+                loves_to_mint = Decimal(loves_value)
                 now_utc = datetime.now(timezone.utc)
 
-                transaction_data = { "action_id": str(goodwill_action.id), "amount": float(loves_to_mint) }
-                index_of_next_block = self.consensus.add_transaction(transaction_data)
+                # Read the block height on this session rather than through add_transaction(),
+                # whose own scope would commit the claim early; the claim, ledger entry and
+                # credit must commit (or roll back) together.
+                index_of_next_block = self.consensus.next_block_number(session)
                 custom_blockchain_tx_hash = f"CUSTOM_TX_{uuid.uuid4().hex}"
 
-                goodwill_action.mark_issued_on_chain(tx_hash=custom_blockchain_tx_hash)
-                user_account.balance += loves_to_mint
-                
                 ledger_entry = LedgerEntry(
                     blockchain_tx_hash=custom_blockchain_tx_hash,
-                    goodwill_action_id=goodwill_action.id,
+                    goodwill_action_id=goodwill_action_id,
                     transaction_type='MINT_GOODWILL',
                     amount=loves_to_mint,
                     token_symbol='LOVES',
                     sender_address=self.minter_wallet_address,
-                    receiver_address=user_wallet.public_address,
+                    receiver_address=receiver_address,
                     block_number=index_of_next_block,
                     block_timestamp=now_utc,
                     status='CONFIRMED',
-                    initiator_user_id=user_account.id,
-                    receiver_user_id=user_account.id,
+                    initiator_user_id=performer_id,
+                    receiver_user_id=performer_id,
                 )
                 session.add(ledger_entry)
-                
-                msg = f"Successfully minted {loves_to_mint:.4f} Loves for user {user_account.id}."
+
+                # Credit last: execute() autoflushes the pending ledger INSERT first, so the
+                # UserAccount row lock is held only for this UPDATE, the pool push and the
+                # commit. The increment runs in the database so concurrent credits are not lost.
+                session.execute(
+                    update(UserAccount)
+                    .where(UserAccount.id == performer_id)
+                    .values(balance=UserAccount.balance + loves_to_mint)
+                )
+
+                # Queue for the chain only once every database write has succeeded: the Redis
+                # pool cannot be rolled back, and only the commit is left after this.
+                transaction_data = { "action_id": str(goodwill_action_id), "amount": float(loves_to_mint) }
+                self.consensus.queue_transaction(transaction_data)
+
+                msg = f"Successfully minted {loves_to_mint:.4f} Loves for user {performer_id}."
                 logger.info(msg)
                 return True, msg, http.HTTPStatus.OK
 
-            except NoResultFound:
-                msg = f"Minting failed: GoodwillAction ID {goodwill_action_id} not found."
-                return False, msg, http.HTTPStatus.NOT_FOUND
             except Exception as e:
-                logger.exception(f"Unexpected error processing mint for GoodwillAction ID {goodwill_action_id}: {e}")
+                # Nothing has been committed yet: this undoes the claim, ledger entry and
+                # credit, leaving the action VERIFIED so it can be retried.
+                session.rollback()
+                logger.exception("Unexpected error processing mint for GoodwillAction ID %s: %s", goodwill_action_id, e)
                 return False, "An internal error occurred during minting.", http.HTTPStatus.INTERNAL_SERVER_ERROR
 
 # Singleton Instance
@@ -175,7 +175,7 @@ class ImmuneSystem:
             timestamps.append(now)
             limited = len(timestamps) > max_reqs
             if limited:
-                logger.debug(f"🛡️ Rate limit exceeded for {identifier}: {len(timestamps)} requests in {window} seconds.")
+                logger.debug("🛡️ Rate limit exceeded for %s: %d requests in %s seconds.", identifier, len(timestamps), window)
             return limited
 
     def check(self) -> Callable:
@@ -210,14 +210,14 @@ class ImmuneSystem:
                 expired_blacklist = [id_ for id_, expiry in self._blacklist.items() if expiry <= now]
                 for id_ in expired_blacklist:
                     del self._blacklist[id_]
-                    logger.debug(f"🛡️ Removed expired blacklist entry: {id_}")
+                    logger.debug("🛡️ Removed expired blacklist entry: %s", id_)
 
                 # Clean old greylist entries (> quarantine time)
                 quarantine = self.config.get("IMMUNE_QUARANTINE_TIME_SEC", 300)
                 expired_greylist = [id_ for id_, data in self._greylist.items() if (now - data["last_seen"]) > quarantine]
                 for id_ in expired_greylist:
                     del self._greylist[id_]
-                    logger.debug(f"🛡️ Removed expired greylist entry: {id_}")
+                    logger.debug("🛡️ Removed expired greylist entry: %s", id_)
 
                 # Clean old rate limit timestamps outside window
                 window = self.config.get("IMMUNE_RATE_LIMIT_WINDOW_SEC", 60)
@@ -22,7 +22,7 @@ def get_metabolic_status() -> Dict[str, object]:
             "message": "Metabolic system operational",
             "lastChecked": datetime.datetime.utcnow().isoformat() + "Z",
         }
-        logger.debug(f"Metabolic status: {status}")
+        logger.debug("Metabolic status: %s", status)
         return status
     except Exception as e:
         logger.error(f"Error fetching metabolic status: {e}", exc_info=True)
@@ -41,7 +41,7 @@ def get_metabolic_transaction_state(transaction_id: str) -> Dict[str, object]:
     try:
         txn = _transaction_states.get(transaction_id)
         if txn:
-            logger.debug(f"Found metabolic transaction state: {txn}")
+            logger.debug("Found metabolic transaction state: %s", txn)
             return txn
         else:
             # Default state if not found
@@ -50,7 +50,7 @@ def get_metabolic_transaction_state(transaction_id: str) -> Dict[str, object]:
                 "state": "pending",
                 "lastUpdated": datetime.datetime.utcnow().isoformat() + "Z",
             }
-            logger.debug(f"Returning default metabolic transaction state: {default_state}")
+            logger.debug("Returning default metabolic transaction state: %s", default_state)
             return default_state
     except Exception as e:
         logger.error(f"Error getting metabolic transaction state for {transaction_id}: {e}", exc_info=True)
@@ -1,115 +1,238 @@
 # peoples_coin/systems/controller.py
 
+import atexit
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
 
 from flask import Flask
 from sqlalchemy import text
+from sqlalchemy.engine import Connection
 
 from peoples_coin.extensions import db
 from peoples_coin.models import ControllerAction # Import the correct model
+from peoples_coin.utils.metrics import observe_latency
 
 logger = logging.getLogger("controller")
 
+# Built once so every cycle reuses the same statement (and cached compilation).
+# Served by idx_goodwill_actions_status in schema.sql.
+_PENDING_ACTIONS_STMT = text(
+    "SELECT COUNT(*) FROM goodwill_actions WHERE status = 'PENDING_VERIFICATION'"
+)
+PENDING_ACTIONS_CACHE_KEY = "controller:pending_actions"
+
 class SystemController:
     """Analyzes system metrics and makes scaling or management recommendations."""
     def __init__(self):
         self.app: Optional[Flask] = None
-        self.last_action_time: Optional[datetime] = None
+        self.redis: Optional[Any] = None
+        # time.monotonic() of the last management action; immune to wall-clock jumps.
+        self.last_action_at: Optional[float] = None
+        self._scheduler = None
+        self._pending_log: deque = deque()
+        self._log_lock = threading.Lock()
         self._initialized = False
         logger.info("🎮 Controller instance created.")
 
-    def init_app(self, app: Flask):
-        """Initializes the controller with the Flask app context."""
+    def init_app(self, app: Flask, redis_instance: Optional[Any] = None):
+        """Initializes the controller with the Flask app context and an optional Redis cache."""
         if self._initialized:
             return
         self.app = app
-        self.cooldown_period = timedelta(
-            minutes=self.app.config.get("CONTROLLER_COOLDOWN_MINUTES", 10)
-        )
+        self.redis = redis_instance
+        self.metrics_cache_ttl = self.app.config.get("CONTROLLER_METRICS_CACHE_TTL_SEC", 60)
+        self.cooldown_seconds = self.app.config.get("CONTROLLER_COOLDOWN_MINUTES", 10) * 60
+        self.cycle_interval_minutes = self.app.config.get("CONTROLLER_INTERVAL_MINUTES", 5)
+        # Audit rows are buffered and written in one batch every N logged cycles.
+        self.log_flush_every = self.app.config.get("CONTROLLER_LOG_FLUSH_EVERY", 12)
+        # Bound the buffer so a DB outage can't grow it without limit; oldest rows drop first.
+        self._pending_log = deque(maxlen=self.log_flush_every * 10)
+        atexit.register(self.flush_log)
         self._initialized = True
         logger.info("🎮 Controller initialized.")
 
-    def analyze(self) -> dict:
-        """Analyzes database metrics to generate recommendations."""
-        logger.info("🔍 Running analysis...")
-        recommendations = {}
-        if not self.app:
-            return recommendations
+    def start(self):
+        """Schedules run_cycle on a background scheduler so the caller's thread stays free."""
+        if not self._initialized:
+            raise RuntimeError("Cannot start: SystemController not initialized.")
+        if self.is_running():
+            return
 
-        with self.app.app_context():
-            try:
-                with db.engine.connect() as conn:
-                    # Check for a backlog of goodwill actions
-                    pending_actions_query = text(
-                        "SELECT COUNT(*) FROM goodwill_actions WHERE status = 'PENDING_VERIFICATION'"
-                    )
-                    pending_actions = conn.execute(pending_actions_query).scalar() or 0
-                    logger.info(f"📊 Pending goodwill actions: {pending_actions}")
-
-                    if pending_actions > self.app.config.get("CONTROLLER_BACKLOG_THRESHOLD", 100):
-                        recommendations["scale_up"] = "High backlog of goodwill actions."
-                        logger.warning("📈 High backlog detected, recommend scaling up.")
-                    
-                    # TODO: Implement a real metrics source (e.g., Prometheus, Cloud Monitoring)
-                    # The 'system_metrics' table does not exist in the schema.
-                    # The following is an example of how you would use it if it existed.
-                    # elif hourly_avg_cpu < 30 and pending_actions < 10:
-                    #     recommendations["scale_down"] = "Low load and clear backlog."
-                    #     logger.info("📉 Low load and clear backlog, recommend scaling down.")
+        # Imported here so processes that never run the controller skip the import cost.
+        from apscheduler.executors.pool import ThreadPoolExecutor
+        from apscheduler.schedulers.background import BackgroundScheduler
 
-            except Exception as e:
-                logger.error(f"DB analysis error: {e}", exc_info=True)
+        logger.info("▶️ Starting controller scheduler...")
+        self._scheduler = BackgroundScheduler(
+            executors={"default": ThreadPoolExecutor(max_workers=2)},
+            timezone="UTC",
+        )
+        self._scheduler.add_job(
+            self.run_cycle,
+            "interval",
+            minutes=self.cycle_interval_minutes,
+            id="controller_cycle",
+            # A slow cycle must never overlap the next one or queue up a
+            # backlog of missed runs; late runs collapse into one.
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=60,
+        )
+        self._scheduler.start()
+
+    def stop(self):
+        """Shuts down the background scheduler, waiting for a running cycle to finish."""
+        if self.is_running():
+            logger.info("🛑 Stopping controller scheduler...")
+            self._scheduler.shutdown(wait=True)
+            self._scheduler = None
+            self.flush_log()
+            logger.info("✅ Controller scheduler stopped.")
+
+    def is_running(self) -> bool:
+        """Checks if the background scheduler is active."""
+        return bool(self._scheduler and self._scheduler.running)
+
+    def _cached(self, key: str, loader: Callable[[], int]) -> int:
+        """Returns a metric from Redis if fresh, otherwise loads it and caches it for metrics_cache_ttl."""
+        if self.redis is None:
+            return loader()
+        try:
+            cached = self.redis.get(key)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            logger.warning("Metrics cache read failed for %s: %s", key, e)
+            return loader()
+
+        value = loader()
+        try:
+            self.redis.setex(key, self.metrics_cache_ttl, value)
+        except Exception as e:
+            logger.warning("Metrics cache write failed for %s: %s", key, e)
+        return value
+
+    def _count_pending_actions(self, conn: Connection) -> int:
+        with observe_latency("controller_pending_actions"):
+            return conn.execute(_PENDING_ACTIONS_STMT).scalar() or 0
+
+    def analyze(self, conn: Connection) -> dict:
+        """Analyzes database metrics on the cycle's connection to generate recommendations."""
+        logger.info("🔍 Running analysis...")
+        recommendations = {}
 
-        logger.info(f"Recommendations: {recommendations}")
+        try:
+            # Check for a backlog of goodwill actions
+            pending_actions = self._cached(
+                PENDING_ACTIONS_CACHE_KEY,
+                lambda: self._count_pending_actions(conn),
+            )
+            logger.info("📊 Pending goodwill actions: %d", pending_actions)
+
+            if pending_actions > self.app.config.get("CONTROLLER_BACKLOG_THRESHOLD", 100):
+                recommendations["scale_up"] = "High backlog of goodwill actions."
+                logger.warning("📈 High backlog detected, recommend scaling up.")
+
+            # TODO: Implement a real metrics source (e.g., Prometheus, Cloud Monitoring)
+            # The 'system_metrics' table does not exist in the schema.
+            # The following is an example of how you would use it if it existed.
+            # elif hourly_avg_cpu < 30 and pending_actions < 10:
+            #     recommendations["scale_down"] = "Low load and clear backlog."
+            #     logger.info("📉 Low load and clear backlog, recommend scaling down.")
+
+        except Exception as e:
+            # Clear the failed transaction so the connection stays usable for logging
+            conn.rollback()
+            logger.error("DB analysis error: %s", e, exc_info=True)
+
+        logger.info("Recommendations: %s", recommendations)
         return recommendations
 
     def manage(self, recommendations: dict) -> list:
         """Acts on recommendations, respecting a cooldown period."""
-        if self.last_action_time and (datetime.now(timezone.utc) - self.last_action_time < self.cooldown_period):
+        if self.last_action_at is not None and time.monotonic() - self.last_action_at < self.cooldown_seconds:
             logger.info("❄️ In cooldown period, skipping management actions.")
             return []
 
         actions_taken = []
         if recommendations.get("scale_up"):
-            logger.info(f"🔼 Triggering scale-up action (placeholder). Reason: {recommendations['scale_up']}")
+            logger.info("🔼 Triggering scale-up action (placeholder). Reason: %s", recommendations["scale_up"])
             actions_taken.append("Scale-up triggered.")
         if recommendations.get("scale_down"):
-            logger.info(f"🔽 Triggering scale-down action (placeholder). Reason: {recommendations['scale_down']}")
+            logger.info("🔽 Triggering scale-down action (placeholder). Reason: %s", recommendations["scale_down"])
             actions_taken.append("Scale-down triggered.")
         
         if actions_taken:
-            self.last_action_time = datetime.now(timezone.utc)
+            self.last_action_at = time.monotonic()
         
         return actions_taken
 
-    def _log_action_to_db(self, recommendations: dict, actions_taken: list):
-        """Logs the analysis and actions to the database."""
+    def _log_action_to_db(self, conn: Connection, recommendations: dict, actions_taken: list):
+        """Buffers the analysis and actions, flushing to the database every log_flush_every cycles."""
         if not recommendations and not actions_taken:
             return
+
+        with self._log_lock:
+            self._pending_log.append({
+                "timestamp": datetime.now(timezone.utc),
+                "recommendations": recommendations,
+                "actions_taken": actions_taken,
+            })
+            if len(self._pending_log) >= self.log_flush_every:
+                self._flush_log(conn)
+
+    def _flush_log(self, conn: Connection):
+        """Writes all buffered rows in one batch. Caller must hold _log_lock."""
+        if not self._pending_log:
+            return
+        try:
+            rows = list(self._pending_log)
+            with observe_latency("controller_log_flush"):
+                if conn.dialect.name == "postgresql":
+                    # One multi-row INSERT ... VALUES: a single round trip on
+                    # any driver (pg8000 has no execute_values fast path).
+                    conn.execute(ControllerAction.__table__.insert().values(rows))
+                else:
+                    conn.execute(ControllerAction.__table__.insert(), rows)
+                conn.commit()
+            logger.info("Logged %d controller actions to DB.", len(self._pending_log))
+            self._pending_log.clear()
+        except Exception as e:
+            # Keep the rows buffered so the next flush retries them
+            conn.rollback()
+            logger.error("Failed to log actions to DB: %s", e, exc_info=True)
+
+    def flush_log(self):
+        """Writes any buffered controller actions now, e.g. on shutdown."""
+        if not self.app or not self._pending_log:
+            return
+        with self.app.app_context():
+            with self._log_lock:
+                try:
+                    with db.engine.connect() as conn:
+                        self._flush_log(conn)
+                except Exception as e:
+                    logger.error("Failed to flush controller actions: %s", e, exc_info=True)
+
+    def run_cycle(self):
+        """Runs one full analyze-manage-log cycle on a single pooled connection."""
         if not self.app:
             return
-            
+
         with self.app.app_context():
             try:
-                db.session.add(
-                    ControllerAction(
-                        recommendations=recommendations,
-                        actions_taken=actions_taken,
-                    )
-                )
-                db.session.commit()
-                logger.info("Logged actions to DB.")
+                with db.engine.connect() as conn:
+                    with observe_latency("controller_analyze"):
+                        recommendations = self.analyze(conn)
+                    with observe_latency("controller_manage"):
+                        actions_taken = self.manage(recommendations)
+                    self._log_action_to_db(conn, recommendations, actions_taken)
             except Exception as e:
-                db.session.rollback()
-                logger.error(f"Failed to log actions to DB: {e}", exc_info=True)
-
-    def run_cycle(self):
-        """Runs one full analyze-manage-log cycle."""
-        recommendations = self.analyze()
-        actions_taken = self.manage(recommendations)
-        self._log_action_to_db(recommendations, actions_taken)
+                logger.error("Controller cycle failed: %s", e, exc_info=True)
 
 # Singleton instance
 controller_system = SystemController()
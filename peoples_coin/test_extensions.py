@@ -17,11 +17,12 @@ for p in sys.path:
     print(p)
 
 # Now import your modules
-from peoples_coin.extensions import db, migrate, cors, limiter, swagger, celery
+from peoples_coin.extensions import db, migrate, cors, limiter, celery
 
 
 from flask import Flask
-from peoples_coin.extensions import db, migrate, cors, limiter, swagger, celery
+from flasgger import Swagger
+from peoples_coin.extensions import db, migrate, cors, limiter, celery
 
 def create_test_app():
     app = Flask(__name__)
@@ -42,7 +43,7 @@ def create_test_app():
     migrate.init_app(app, db)
     cors.init_app(app)
     limiter.init_app(app)
-    swagger.init_app(app)
+    Swagger(app)
 
     # Configure Celery
     celery.conf.broker_url = app.config["CELERY_BROKER_URL"]
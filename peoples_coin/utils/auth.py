@@ -1,18 +1,54 @@
 # src/peoples_coin/utils/auth.py
 
+import atexit
 import http
+import hashlib
 import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
 from functools import wraps
-from flask import request, jsonify, g
+from typing import Any, Dict, Optional, Tuple
+from flask import Flask, current_app, request, jsonify, g
 from firebase_admin import auth as firebase_auth
-from sqlalchemy import func
+from sqlalchemy import text
 
 from peoples_coin.extensions import db
 from peoples_coin.models import ApiKey
+from peoples_coin.utils.cache import TTLCache
+from peoples_coin.utils.metrics import observe_latency
 
 logger = logging.getLogger(__name__)
 KEY_ERROR = "error"
 
+# Verified Firebase claims are cached per token so repeat requests skip the
+# RSA signature check (and any JWK refetch). Entries never outlive the token.
+FIREBASE_TOKEN_CACHE_TTL_SEC = 300
+FIREBASE_TOKEN_CACHE_MAX_SIZE = 10_000
+
+# API keys resolve to (user_id, expires_at) and are cached briefly so hot keys
+# skip the api_keys lookup; a revoked key stays usable for at most the TTL.
+API_KEY_CACHE_TTL_SEC = 60
+API_KEY_CACHE_MAX_SIZE = 10_000
+# last_used_at stamps are buffered per key and written in one batch this often
+# by a per-process flusher thread, never on a request thread.
+API_KEY_USAGE_FLUSH_INTERVAL_SEC = 5
+# last_used_at is kept to this resolution: a key is stamped at most once per window.
+API_KEY_LAST_USED_RESOLUTION_SEC = 60
+
+_UPDATE_LAST_USED_STMT = text("UPDATE api_keys SET last_used_at = :ts WHERE key = :k")
+
+
+_token_cache = TTLCache(FIREBASE_TOKEN_CACHE_MAX_SIZE)
+_api_key_cache = TTLCache(API_KEY_CACHE_MAX_SIZE)
+_api_key_stamped = TTLCache(API_KEY_CACHE_MAX_SIZE)
+
+_api_key_usage: Dict[str, datetime] = {}
+_api_key_usage_lock = threading.Lock()
+# pid that owns the running flusher thread; threads do not survive fork.
+_usage_flusher_pid: Optional[int] = None
+
 
 # ------------------------------------------------------------------------------
 # Firebase Auth Support
@@ -20,12 +56,27 @@ KEY_ERROR = "error"
 
 class FirebaseUser:
     """Lightweight object to hold Firebase-authenticated user info."""
+    __slots__ = ("firebase_uid", "email", "username")
+
     def __init__(self, uid, email=None, username=None):
         self.firebase_uid = uid
         self.email = email
         self.username = username
 
 
+def _verify_id_token(id_token: str) -> dict:
+    """Verify a Firebase ID token, reusing recently verified claims for the same token."""
+    cache_key = hashlib.blake2b(id_token.encode(), digest_size=16).digest()
+    claims = _token_cache.get(cache_key)
+    if claims is None:
+        with observe_latency("firebase_verify"):
+            claims = firebase_auth.verify_id_token(id_token)
+        # Cache until the sooner of the token's exp and the cache TTL.
+        now = time.time()
+        _token_cache.set(cache_key, claims, min(now + FIREBASE_TOKEN_CACHE_TTL_SEC, claims.get("exp", now)))
+    return claims
+
+
 def require_firebase_token(f):
     """Decorator to protect routes with a Firebase ID token."""
     @wraps(f)
@@ -37,7 +88,7 @@ def require_firebase_token(f):
         id_token = auth_header.split("Bearer ")[1]
 
         try:
-            decoded_token = firebase_auth.verify_id_token(id_token)
+            decoded_token = _verify_id_token(id_token)
             uid = decoded_token.get("uid")
             email = decoded_token.get("email")
             display_name = decoded_token.get("name")
@@ -53,7 +104,7 @@ def require_firebase_token(f):
             )
 
         except Exception as e:
-            logger.error(f"Firebase token verification failed: {e}")
+            logger.error("Firebase token verification failed: %s", e)
             return jsonify({KEY_ERROR: "Invalid, expired, or revoked token"}), http.HTTPStatus.UNAUTHORIZED
 
         return f(*args, **kwargs)
@@ -64,30 +115,116 @@ def require_firebase_token(f):
 # API Key Auth Support
 # ------------------------------------------------------------------------------
 
+def _lookup_api_key(api_key: str) -> Optional[Tuple[Any, Optional[float]]]:
+    """Resolve an API key to (user_id, expires_at epoch), or None if it does not exist."""
+    entry = _api_key_cache.get(api_key)
+    if entry is not None:
+        return entry
+
+    with observe_latency("api_key_lookup"):
+        row = db.session.query(ApiKey.user_id, ApiKey.expires_at).filter_by(key=api_key).first()
+    if row is None:
+        # Unknown keys are not cached so random probes cannot flush real entries.
+        return None
+
+    entry = (row.user_id, row.expires_at.timestamp() if row.expires_at else None)
+    _api_key_cache.set(api_key, entry, time.time() + API_KEY_CACHE_TTL_SEC)
+    return entry
+
+
+def _record_api_key_use(api_key: str) -> None:
+    """Buffer a last_used_at stamp; flush_api_key_usage writes it later."""
+    # Busy keys were stamped moments ago; skip them until the window lapses.
+    if _api_key_stamped.get(api_key) is not None:
+        return
+    _api_key_stamped.set(api_key, True, time.time() + API_KEY_LAST_USED_RESOLUTION_SEC)
+
+    with _api_key_usage_lock:
+        _api_key_usage[api_key] = datetime.now(timezone.utc)
+    _ensure_usage_flusher()
+
+
+def _ensure_usage_flusher() -> None:
+    """Starts this process's flusher thread on first use; keyed by pid so forked workers start their own."""
+    global _usage_flusher_pid
+    pid = os.getpid()
+    if _usage_flusher_pid == pid:
+        return
+    with _api_key_usage_lock:
+        if _usage_flusher_pid == pid:
+            return
+        _usage_flusher_pid = pid
+
+    app = current_app._get_current_object()
+    threading.Thread(
+        target=_usage_flush_loop, args=(app,), name="api-key-usage-flusher", daemon=True
+    ).start()
+    # The daemon thread dies with the interpreter; write whatever is left on a clean exit.
+    atexit.register(_flush_in_context, app)
+
+
+def _flush_in_context(app: Flask) -> None:
+    with app.app_context():
+        flush_api_key_usage()
+
+
+def _usage_flush_loop(app: Flask) -> None:
+    while True:
+        time.sleep(API_KEY_USAGE_FLUSH_INTERVAL_SEC)
+        try:
+            _flush_in_context(app)
+        except Exception as e:
+            logger.warning("API key usage flusher error: %s", e)
+
+
+def flush_api_key_usage() -> None:
+    """
+    Writes buffered last_used_at stamps in one batch on a connection of its own,
+    so it never touches a request's session. Needs an app context.
+    """
+    with _api_key_usage_lock:
+        if not _api_key_usage:
+            return
+        pending = [{"k": k, "ts": ts} for k, ts in _api_key_usage.items()]
+        _api_key_usage.clear()
+
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(_UPDATE_LAST_USED_STMT, pending)
+    except Exception as e:
+        # Usage stamps are best-effort; keep them for the next flush unless a newer stamp arrived.
+        with _api_key_usage_lock:
+            for row in pending:
+                _api_key_usage.setdefault(row["k"], row["ts"])
+        logger.warning("Failed to flush %d API key usage stamps: %s", len(pending), e)
+
+
 def require_api_key(f):
     """Decorator to require a valid API key via 'X-API-Key' header."""
     @wraps(f)
     def decorated(*args, **kwargs):
-        api_key = request.headers.get("X-API-Key")
+        # WSGI already normalises header names, so read the environ dict directly
+        # instead of going through Werkzeug's case-insensitive EnvironHeaders.
+        api_key = request.environ.get("HTTP_X_API_KEY")
         if not api_key:
             return jsonify({KEY_ERROR: "API key missing"}), http.HTTPStatus.UNAUTHORIZED
 
         try:
-            # Look up the API key in the database
-            key_obj = db.session.query(ApiKey).filter_by(key=api_key).first()
+            entry = _lookup_api_key(api_key)
 
-            if not key_obj:
+            if entry is None:
                 return jsonify({KEY_ERROR: "Invalid API key"}), http.HTTPStatus.FORBIDDEN
 
-            # Check expiration
-            if key_obj.expires_at and key_obj.expires_at < func.now():
+            user_id, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
                 return jsonify({KEY_ERROR: "API key expired"}), http.HTTPStatus.FORBIDDEN
 
-            # Attach the API key's user to g.api_user for downstream use
-            g.api_user = key_obj.user
+            # Expose the owning user's id for downstream use
+            g.api_user_id = user_id
+            _record_api_key_use(api_key)
 
         except Exception as e:
-            logger.error(f"API key validation failed: {e}")
+            logger.error("API key validation failed: %s", e)
             return jsonify({KEY_ERROR: "Internal authentication error"}), http.HTTPStatus.INTERNAL_SERVER_ERROR
 
         return f(*args, **kwargs)
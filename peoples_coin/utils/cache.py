@@ -0,0 +1,65 @@
+# peoples_coin/utils/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Small thread-safe LRU whose entries expire at a per-entry deadline."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live_entry(self, key: Hashable, now: float) -> Optional[Tuple[float, Any]]:
+        """Return the unexpired entry for key, evicting it if stale. Caller must hold _lock."""
+        entry = self._data.get(key)
+        if entry is not None and entry[0] <= now:
+            del self._data[key]
+            return None
+        return entry
+
+    def _store(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """Insert or refresh an entry and trim to max_size. Caller must hold _lock."""
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if absent or expired."""
+        with self._lock:
+            entry = self._live_entry(key, time.time())
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """Store a value until the given epoch timestamp; past deadlines are ignored."""
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            self._store(key, value, expires_at)
+
+    def add(self, key: Hashable, value: Any, expires_at: float) -> bool:
+        """Atomically store a value only if key is absent or expired. Returns True if stored."""
+        now = time.time()
+        if expires_at <= now:
+            return False
+        with self._lock:
+            if self._live_entry(key, now) is not None:
+                return False
+            self._store(key, value, expires_at)
+            return True
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
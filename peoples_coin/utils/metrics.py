@@ -0,0 +1,66 @@
+# peoples_coin/utils/metrics.py
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+from flask import Flask, Response
+
+# prometheus_client is optional; without it latency is simply not recorded.
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Histogram, generate_latest, multiprocess
+except ImportError:
+    Histogram = None
+
+logger = logging.getLogger(__name__)
+
+# Latency of backend calls (DB, Firebase, ...) in seconds, labelled by operation.
+OP_LATENCY = (
+    Histogram("peoples_coin_op_seconds", "Latency of backend operations in seconds.", ["op"])
+    if Histogram
+    else None
+)
+
+
+@contextmanager
+def observe_latency(op: str):
+    """Records the duration of the wrapped block under the given operation label."""
+    if OP_LATENCY is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        OP_LATENCY.labels(op).observe(time.perf_counter() - start)
+
+
+def _collect() -> bytes:
+    """
+    Renders the metrics of every worker when PROMETHEUS_MULTIPROC_DIR is set
+    (gunicorn runs several processes; the default registry only sees its own),
+    otherwise those of this process.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+def init_metrics(app: Flask) -> None:
+    """Exposes the Prometheus registry at /metrics, behind an API key, when prometheus_client is installed."""
+    if OP_LATENCY is None:
+        logger.warning("⚠️ prometheus_client not installed; /metrics endpoint disabled.")
+        return
+
+    # Imported here: utils.auth itself records latency through this module.
+    from peoples_coin.utils.auth import require_api_key
+
+    @require_api_key
+    def metrics():
+        return Response(_collect(), mimetype=CONTENT_TYPE_LATEST)
+
+    app.add_url_rule("/metrics", "metrics", metrics)
+    logger.info("✅ Prometheus metrics exposed at /metrics.")
@@ -1,22 +1,89 @@
+"""
+Server-side reCAPTCHA Enterprise verification.
+
+Environment variables:
+    RECAPTCHA_PROJECT_ID, RECAPTCHA_SITE_KEY, RECAPTCHA_API_KEY: required credentials.
+    RECAPTCHA_MIN_SCORE: minimum risk score accepted (default 0.5); raise it to
+        tighten verification under attack without a redeploy.
+"""
 import os
+import hashlib
 import requests
 import json
 import logging
+import time
+from requests.adapters import HTTPAdapter, Retry
+
+from peoples_coin.extensions import redis_client
+from peoples_coin.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# One process-wide session so verifications reuse keep-alive TLS connections
+# to Google instead of paying a TCP + TLS handshake on every login. POST is not
+# idempotent, so only connection failures (request never sent) are retried.
+_http_session = requests.Session()
+_http_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=Retry(total=1, backoff_factor=0.1)),
+)
+# (connect, read) timeouts in seconds
+RECAPTCHA_TIMEOUT = (2, 3)
+
 # Read reCAPTCHA keys from environment variables
 RECAPTCHA_PROJECT_ID = os.environ.get("RECAPTCHA_PROJECT_ID")
 RECAPTCHA_SITE_KEY_PROD = os.environ.get("RECAPTCHA_SITE_KEY")
 RECAPTCHA_API_KEY = os.environ.get("RECAPTCHA_API_KEY")
+RECAPTCHA_MIN_SCORE = float(os.environ.get("RECAPTCHA_MIN_SCORE", "0.5"))
+RECAPTCHA_CONFIGURED = bool(RECAPTCHA_PROJECT_ID and RECAPTCHA_SITE_KEY_PROD and RECAPTCHA_API_KEY)
+RECAPTCHA_ASSESSMENT_URL = (
+    f"https://recaptchaenterprise.googleapis.com/v1/projects/{RECAPTCHA_PROJECT_ID}/assessments?key={RECAPTCHA_API_KEY}"
+    if RECAPTCHA_CONFIGURED
+    else None
+)
+
+# reCAPTCHA tokens are single-use and expire after two minutes. Tokens already
+# submitted are remembered (locally, and in Redis so all workers agree) and
+# replays are rejected without a round trip to Google.
+RECAPTCHA_REPLAY_TTL_SEC = 120
+RECAPTCHA_REPLAY_CACHE_SIZE = 10_000
+RECAPTCHA_REPLAY_KEY_PREFIX = "recaptcha:seen:"
+_seen_tokens = TTLCache(RECAPTCHA_REPLAY_CACHE_SIZE)
+
+
+def _claim_token(token_hash: bytes) -> bool:
+    """Marks a token as used. Returns False if it was already claimed."""
+    if not _seen_tokens.add(token_hash, True, time.time() + RECAPTCHA_REPLAY_TTL_SEC):
+        return False
+    try:
+        return bool(redis_client.set(
+            RECAPTCHA_REPLAY_KEY_PREFIX + token_hash.hex(), 1, nx=True, ex=RECAPTCHA_REPLAY_TTL_SEC
+        ))
+    except Exception as e:
+        # Redis is a best-effort second tier; the local cache still applies.
+        logger.debug("reCAPTCHA replay check skipped Redis: %s", e)
+        return True
+
+
+def _release_token(token_hash: bytes) -> None:
+    """Forgets a claimed token whose verification never reached Google, so it can be retried."""
+    _seen_tokens.discard(token_hash)
+    try:
+        redis_client.delete(RECAPTCHA_REPLAY_KEY_PREFIX + token_hash.hex())
+    except Exception as e:
+        logger.debug("reCAPTCHA replay release skipped Redis: %s", e)
+
 
 def verify_recaptcha(token: str, expected_action: str, user_ip: str = None, user_agent: str = None):
     # Check if a critical key is missing and log an error
-    if not RECAPTCHA_PROJECT_ID or not RECAPTCHA_SITE_KEY_PROD or not RECAPTCHA_API_KEY:
+    if not RECAPTCHA_CONFIGURED:
         logger.error("🚨 reCAPTCHA environment variables are not set correctly.")
         return False, "Server-side reCAPTCHA configuration error."
 
-    url = f"https://recaptchaenterprise.googleapis.com/v1/projects/{RECAPTCHA_PROJECT_ID}/assessments?key={RECAPTCHA_API_KEY}"
+    token_hash = hashlib.sha256(token.encode()).digest()
+    if not _claim_token(token_hash):
+        logger.warning("reCAPTCHA token replay rejected.")
+        return False, "reCAPTCHA token has already been used."
 
     payload = {
         "event": {
@@ -32,18 +99,22 @@ def verify_recaptcha(token: str, expected_action: str, user_ip: str = None, user
         payload["event"]["userAgent"] = user_agent
 
     try:
-        response = requests.post(url, json=payload, timeout=5)
+        response = _http_session.post(RECAPTCHA_ASSESSMENT_URL, json=payload, timeout=RECAPTCHA_TIMEOUT)
         response.raise_for_status()
 
         data = response.json()
         if data.get("tokenProperties", {}).get("valid", False) and \
-           data.get("riskAnalysis", {}).get("score", 0) >= 0.5:
+           data.get("riskAnalysis", {}).get("score", 0) >= RECAPTCHA_MIN_SCORE:
             return True, "reCAPTCHA verification successful."
         else:
             return False, data.get("tokenProperties", {}).get("invalidReason", "Unknown reason")
 
     except requests.RequestException as e:
-        logger.error(f"Error verifying recaptcha: {e}", exc_info=True)
+        # Only a connection failure leaves the token unspent; an HTTP error
+        # response means Google saw it.
+        if e.response is None:
+            _release_token(token_hash)
+        logger.error("Error verifying recaptcha: %s", e, exc_info=True)
         return False, f"Error verifying recaptcha: {e}"
 
 
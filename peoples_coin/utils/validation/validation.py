@@ -38,6 +38,10 @@ class Contribution(BaseModel):
         extra = Extra.forbid
 
 
+# Compiled pydantic-core entry point for Contribution (no model_validate wrapper).
+_validate_contribution_model = Contribution.__pydantic_validator__.validate_python
+
+
 # ==============================================================================
 # 2. Explicit and Unambiguous Return Models
 # ==============================================================================
@@ -68,11 +72,12 @@ def validate_contribution(data: dict) -> ValidationResult:
         A ValidationResult object that is unambiguous and easy to use.
     """
     try:
-        validated_contribution = Contribution.model_validate(data)
+        validated_contribution = _validate_contribution_model(data)
         return ValidationResult(is_valid=True, data=validated_contribution)
     except ValidationError as e:
-        logger.warning(f"Validation failed for contribution: {e.errors()}")
-        return ValidationResult(is_valid=False, errors=e.errors())
+        errors = e.errors()
+        logger.warning("Validation failed for contribution: %s", errors)
+        return ValidationResult(is_valid=False, errors=errors)
 
 
 def validate_contributions_batch(transactions: List[dict]) -> BatchValidationResult:
@@ -85,17 +90,24 @@ def validate_contributions_batch(transactions: List[dict]) -> BatchValidationRes
     valid_items = []
     invalid_items = []
 
+    # Validate items directly rather than through validate_contribution, so
+    # the batch does not build a ValidationResult or log a warning per item.
     for i, tx_data in enumerate(transactions):
-        result = validate_contribution(tx_data)
-        if result.is_valid:
-            valid_items.append(result.data)
-        else:
+        try:
+            valid_items.append(_validate_contribution_model(tx_data))
+        except ValidationError as e:
             invalid_items.append({
                 "index": i,
                 "original_data": tx_data,
-                "errors": result.errors
+                "errors": e.errors()
             })
 
+    if invalid_items:
+        logger.warning(
+            "Batch validation rejected %d of %d contributions at indices %s",
+            len(invalid_items), len(transactions), [item["index"] for item in invalid_items],
+        )
+
     return BatchValidationResult(
         all_valid=not invalid_items,
         valid_items=valid_items,
@@ -132,10 +144,11 @@ def validate_with(schema: Type[BaseModel]) -> Callable:
                 validated = schema.model_validate(json_data)
                 request.validated_data = validated
             except ValidationError as e:
-                logger.warning(f"Request validation error: {e.errors()}")
-                return jsonify({"errors": e.errors()}), 400
+                errors = e.errors()
+                logger.warning("Request validation error: %s", errors)
+                return jsonify({"errors": errors}), 400
             except Exception as e:
-                logger.error(f"Unexpected error during validation: {e}")
+                logger.error("Unexpected error during validation: %s", e)
                 return jsonify({"error": "Invalid request data"}), 400
 
             return f(*args, **kwargs)
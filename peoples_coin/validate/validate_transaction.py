@@ -2,87 +2,235 @@
 
 import json
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import Union, Dict, Any, List, Optional, Callable, Set
-from uuid import UUID, uuid4
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from json.encoder import encode_basestring_ascii
+from typing import AbstractSet, Union, Dict, Any, List, Optional, Callable
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing_extensions import Literal
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
-from cryptography.exceptions import InvalidSignature
-from base64 import b64decode
+from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+from binascii import a2b_base64
 
 logger = logging.getLogger(__name__)
 
 # --- Configuration ---
 MAX_TIMESTAMP_SKEW_SECONDS = 300  # 5 minutes
+# Input limits enforced before (and during) schema validation.
+MAX_TRANSACTION_FIELDS = 32
+MAX_TIMESTAMP_LENGTH = 40
+MAX_FIELD_LENGTH = 4096
+# Parsed public keys are kept for recurring signers so PEM parsing and EC
+# point decoding happen once per key rather than once per transaction.
+PUBLIC_KEY_CACHE_SIZE = 4096
+# Bounds of a DER-encoded ECDSA signature, from tiny r/s up to P-521.
+MIN_DER_SIGNATURE_BYTES = 8
+MAX_DER_SIGNATURE_BYTES = 139
+PEM_PREFIX = "-----BEGIN "
+
+# Rejection warnings are sampled so a flood of bad traffic cannot turn into a
+# flood of log writes: at most RATE lines/second, with bursts up to BURST.
+VALIDATION_WARNING_LOG_RATE = 10.0
+VALIDATION_WARNING_LOG_BURST = 20
+
+
+# Reused for every signed payload; json.dumps would build a new encoder per call
+# whenever non-default options are passed.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+# Signature algorithm objects are immutable; build the verify parameter once.
+_ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+
+# The C string encoder behind json.dumps' default ensure_ascii=True.
+_encode_str = encode_basestring_ascii
+# Example: High-value actions must be signed.
+HIGH_VALUE_ACTIONS = frozenset({"treasury_spend", "protocol_change"})
 
 # --- Pydantic Schemas ---
+_utcnow = partial(datetime.now, timezone.utc)
+
 class TransactionModel(BaseModel):
+    model_config = ConfigDict(str_max_length=MAX_FIELD_LENGTH)
+
     user_id: str
     action_type: str
     description: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
     loves_value: int = Field(..., ge=1, le=100)
     contextual_data: Dict[str, Any] = Field(default_factory=dict)
     correlation_id: Optional[str] = None
     signature: Optional[str] = None
     public_key_pem: Optional[str] = None
 
-class ValidationSuccess(BaseModel):
+# Bound once: calling pydantic-core's compiled validator directly skips the
+# model_validate classmethod wrapper on every transaction.
+_validate_transaction_model = TransactionModel.__pydantic_validator__.validate_python
+
+# Results are plain slotted dataclasses: they wrap values that were already
+# validated, so running them through Pydantic again would be wasted work.
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ValidationSuccess:
     is_valid: Literal[True] = True
     data: Dict[str, Any]
 
-class ValidationFailure(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ValidationFailure:
     is_valid: Literal[False] = False
     errors: List[Dict[str, Any]]
 
+# --- Log Sampling ---
+class _LogSampler:
+    """Token bucket deciding whether a high-volume log line may be emitted."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> Optional[int]:
+        """
+        Returns None if the line should be dropped; otherwise the number of
+        lines suppressed since the last one that was allowed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                self._suppressed += 1
+                return None
+            self._tokens -= 1
+            suppressed, self._suppressed = self._suppressed, 0
+            return suppressed
+
+_warning_sampler = _LogSampler(VALIDATION_WARNING_LOG_RATE, VALIDATION_WARNING_LOG_BURST)
+
+def _log_rejection(msg: str, *args: Any) -> None:
+    """Emits a sampled warning for a rejected transaction."""
+    suppressed = _warning_sampler.allow()
+    if suppressed is None:
+        return
+    if suppressed:
+        logger.warning(msg + " (%d similar warnings suppressed)", *args, suppressed)
+    else:
+        logger.warning(msg, *args)
+
 # --- Helper Functions ---
+def _cheap_precheck(
+    data: Any,
+    authenticated_user_id: str,
+    allowed_contributors: AbstractSet[str],
+) -> List[Dict[str, Any]]:
+    """
+    Runs the O(1) checks that can reject a request before schema validation.
+    Returns a list of errors, empty if the payload may proceed.
+    """
+    if not isinstance(data, dict):
+        return [{"loc": ["_general"], "msg": "Transaction payload must be a JSON object."}]
+    if len(data) > MAX_TRANSACTION_FIELDS:
+        return [{"loc": ["_general"], "msg": f"Transaction payload has more than {MAX_TRANSACTION_FIELDS} fields."}]
+
+    errors = []
+    timestamp = data.get("timestamp")
+    if isinstance(timestamp, str) and len(timestamp) > MAX_TIMESTAMP_LENGTH:
+        errors.append({"loc": ["timestamp"], "msg": "Timestamp is too long."})
+
+    # A non-string user_id is left for the schema to report.
+    user_id = data.get("user_id")
+    if isinstance(user_id, str):
+        # Authentication Check: Does the payload user match the token user?
+        if user_id != authenticated_user_id:
+            errors.append({"loc": ["user_id"], "msg": "Payload user ID does not match authenticated user."})
+        # Authorization Check: Is the user on the whitelist?
+        if user_id not in allowed_contributors:
+            errors.append({"loc": ["user_id"], "msg": f"User '{user_id}' is not an allowed contributor."})
+    return errors
+
 def _is_signature_required(action_type: str) -> bool:
     """Determines if a signature is mandatory based on the action type."""
-    # Example: High-value actions must be signed.
-    high_value_actions = {"treasury_spend", "protocol_change"}
-    return action_type in high_value_actions
+    return action_type in HIGH_VALUE_ACTIONS
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _load_public_key(public_key_pem: str):
+    """Parses a PEM public key; results are memoized per PEM string."""
+    return serialization.load_pem_public_key(public_key_pem.encode())
+
+def _verify_signature(public_key_pem: str, signature_b64: str, message: bytes) -> bool:
+    """Verifies an ECDSA signature over the canonical payload bytes."""
+    # Malformed client input is a failed verification, not an internal error.
+    # Cheapest checks run first so junk never reaches the PEM parser.
+    if not public_key_pem.startswith(PEM_PREFIX):
+        _log_rejection("Public key is not PEM encoded.")
+        return False
+    try:
+        signature = a2b_base64(signature_b64)
+    except ValueError as e:
+        _log_rejection("Malformed signature: %s", e)
+        return False
+    if not MIN_DER_SIGNATURE_BYTES <= len(signature) <= MAX_DER_SIGNATURE_BYTES:
+        _log_rejection("Signature has implausible length: %d bytes", len(signature))
+        return False
+    try:
+        public_key = _load_public_key(public_key_pem)
+    except (ValueError, UnsupportedAlgorithm) as e:
+        _log_rejection("Malformed public key: %s", e)
+        return False
+    if not isinstance(public_key, ec.EllipticCurvePublicKey):
+        _log_rejection("Unsupported public key type: %s", type(public_key).__name__)
+        return False
 
-def _verify_signature(public_key_pem: str, signature_b64: str, payload: dict) -> bool:
-    """Verifies an ECDSA signature over a JSON payload."""
     try:
-        public_key = serialization.load_pem_public_key(public_key_pem.encode())
-        signature = b64decode(signature_b64)
-        message = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
-        public_key.verify(signature, message, ec.ECDSA(hashes.SHA256()))
-        return True
-    except (InvalidSignature, ValueError, TypeError) as e:
-        logger.warning(f"Signature verification failed: {e}")
+        public_key.verify(signature, message, _ECDSA_SHA256)
+    except InvalidSignature:
+        _log_rejection("Signature verification failed.")
         return False
+    return True
 
 def _is_timestamp_valid(timestamp: datetime) -> bool:
-    """Ensures the timestamp is within an acceptable skew of the current time."""
-    now = datetime.now(timezone.utc)
-    delta = abs((now - timestamp).total_seconds())
-    return delta <= MAX_TIMESTAMP_SKEW_SECONDS
-
-def _extract_signed_payload(validated: TransactionModel) -> dict:
-    """Constructs the exact payload that was signed on the client."""
-    # This must perfectly match the client-side signing implementation.
-    payload = {
-        "user_id": validated.user_id,
-        "action_type": validated.action_type,
-        "description": validated.description,
-        "timestamp": validated.timestamp.isoformat().replace('+00:00', 'Z'),
-        "loves_value": validated.loves_value,
-        "contextual_data": validated.contextual_data
-    }
+    """Ensures the timestamp is timezone-aware and within an acceptable skew of the current time."""
+    # A naive datetime would be read as server-local time by .timestamp().
+    if timestamp.tzinfo is None:
+        return False
+    return abs(time.time() - timestamp.timestamp()) <= MAX_TIMESTAMP_SKEW_SECONDS
+
+def _signed_message(validated: TransactionModel) -> bytes:
+    """
+    Builds the exact bytes that were signed on the client.
+
+    The canonical form is the signed fields serialized as compact JSON with
+    sorted keys (json.dumps(payload, sort_keys=True, separators=(',', ':'))),
+    with correlation_id present only when set. The field set is fixed, so the
+    keys are emitted in sorted order directly instead of building and sorting
+    a dict per transaction. This must perfectly match the client-side signing
+    implementation.
+    """
+    fields = [
+        '{"action_type":', _encode_str(validated.action_type),
+        ',"contextual_data":', _CANONICAL_ENCODER.encode(validated.contextual_data),
+    ]
     if validated.correlation_id:
-        payload["correlation_id"] = validated.correlation_id
-    return payload
+        fields += [',"correlation_id":', _encode_str(validated.correlation_id)]
+    fields += [
+        ',"description":', _encode_str(validated.description),
+        ',"loves_value":', str(validated.loves_value),
+        ',"timestamp":', _encode_str(validated.timestamp.isoformat().replace('+00:00', 'Z')),
+        ',"user_id":', _encode_str(validated.user_id),
+        '}',
+    ]
+    return ''.join(fields).encode('utf-8')
 
 # --- Main Validation Logic ---
 def validate_transaction(
     data: dict,
     authenticated_user_id: str,
-    allowed_contributors_loader: Callable[[], Set[str]]
+    allowed_contributors_loader: Callable[[], AbstractSet[str]]
 ) -> Union[ValidationSuccess, ValidationFailure]:
     """
     Validates transaction data against schema and business rules, including authentication checks.
@@ -93,16 +241,14 @@ def validate_transaction(
         allowed_contributors_loader: A function that returns the current set of allowed contributors.
     """
     try:
-        validated = TransactionModel.model_validate(data)
-        errors = []
-
-        # 1. Authentication Check: Does the payload user match the token user?
-        if validated.user_id != authenticated_user_id:
-            errors.append({"loc": ["user_id"], "msg": "Payload user ID does not match authenticated user."})
+        # 1. Cheap checks first: shape, size, authentication and whitelist.
+        errors = _cheap_precheck(data, authenticated_user_id, allowed_contributors_loader())
+        if errors:
+            _log_rejection("Transaction pre-check failed: %s", errors)
+            return ValidationFailure(is_valid=False, errors=errors)
 
-        # 2. Authorization Check: Is the user on the whitelist?
-        if validated.user_id not in allowed_contributors_loader():
-            errors.append({"loc": ["user_id"], "msg": f"User '{validated.user_id}' is not an allowed contributor."})
+        # 2. Schema validation
+        validated = _validate_transaction_model(data)
 
         # 3. Timestamp Skew Check
         if not _is_timestamp_valid(validated.timestamp):
@@ -113,20 +259,23 @@ def validate_transaction(
             if not validated.signature or not validated.public_key_pem:
                 errors.append({"loc": ["signature"], "msg": "A cryptographic signature is required for this action type."})
             else:
-                payload_to_verify = _extract_signed_payload(validated)
-                if not _verify_signature(validated.public_key_pem, validated.signature, payload_to_verify):
+                message = _signed_message(validated)
+                if not _verify_signature(validated.public_key_pem, validated.signature, message):
                     errors.append({"loc": ["signature"], "msg": "Invalid cryptographic signature."})
         
         if errors:
-            logger.warning(f"Transaction validation failed for user {validated.user_id}: {errors}")
+            _log_rejection("Transaction validation failed for user %s: %s", validated.user_id, errors)
             return ValidationFailure(is_valid=False, errors=errors)
 
-        logger.info(f"✅ Transaction validated for user: {validated.user_id}")
-        return ValidationSuccess(is_valid=True, data=validated.model_dump())
+        logger.info("✅ Transaction validated for user: %s", validated.user_id)
+        # The model's field dict already holds validated values; model_dump()
+        # would rebuild it (and deep-copy contextual_data) for nothing.
+        return ValidationSuccess(is_valid=True, data=validated.__dict__)
 
     except ValidationError as e:
-        logger.warning(f"Pydantic validation failed: {e.errors()}")
-        return ValidationFailure(is_valid=False, errors=e.errors())
+        errors = e.errors()
+        _log_rejection("Pydantic validation failed: %s", errors)
+        return ValidationFailure(is_valid=False, errors=errors)
     except Exception as e:
         logger.exception("💥 Unexpected error during transaction validation.")
         return ValidationFailure(is_valid=False, errors=[{"loc": ["_general"], "msg": str(e), "type": "internal_error"}])
@@ -0,0 +1,145 @@
+"""
+Tests for the Firebase token and API key caches in peoples_coin.utils.auth.
+"""
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from peoples_coin.extensions import db
+from peoples_coin.utils import auth
+
+
+@pytest.fixture(autouse=True)
+def clear_caches(monkeypatch):
+    # Pretend this process's flusher is already running so tests never start the thread.
+    monkeypatch.setattr(auth, "_usage_flusher_pid", os.getpid())
+    caches = (auth._token_cache, auth._api_key_cache, auth._api_key_stamped, auth._api_key_usage)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+def test_verified_token_is_cached(monkeypatch):
+    """A second verification of the same token should not hit Firebase."""
+    calls = []
+
+    def fake_verify(token):
+        calls.append(token)
+        return {"uid": "user-1", "exp": time.time() + 3600}
+
+    monkeypatch.setattr(auth.firebase_auth, "verify_id_token", fake_verify)
+
+    assert auth._verify_id_token("token-a")["uid"] == "user-1"
+    assert auth._verify_id_token("token-a")["uid"] == "user-1"
+    assert calls == ["token-a"]
+
+
+def test_cache_never_outlives_token_expiry(monkeypatch):
+    """Tokens that are already expired must be re-verified every time."""
+    calls = []
+
+    def fake_verify(token):
+        calls.append(token)
+        return {"uid": "user-1", "exp": time.time() - 1}
+
+    monkeypatch.setattr(auth.firebase_auth, "verify_id_token", fake_verify)
+
+    auth._verify_id_token("token-b")
+    auth._verify_id_token("token-b")
+    assert calls == ["token-b", "token-b"]
+
+
+def test_api_key_lookup_is_cached(monkeypatch):
+    """A cached API key should resolve without another database query."""
+    expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+    queries = []
+
+    class FakeQuery:
+        def filter_by(self, **kwargs):
+            queries.append(kwargs)
+            return self
+
+        def first(self):
+            return SimpleNamespace(user_id="user-1", expires_at=expires_at)
+
+    fake_db = SimpleNamespace(session=SimpleNamespace(query=lambda *cols: FakeQuery()))
+    monkeypatch.setattr(auth, "db", fake_db)
+
+    assert auth._lookup_api_key("key-a") == ("user-1", expires_at.timestamp())
+    assert auth._lookup_api_key("key-a") == ("user-1", expires_at.timestamp())
+    assert queries == [{"key": "key-a"}]
+
+
+def test_api_key_use_is_stamped_once_per_window():
+    """Repeated use of a key within the resolution window buffers a single stamp."""
+    auth._record_api_key_use("key-b")
+    first = auth._api_key_usage["key-b"]
+    auth._record_api_key_use("key-b")
+
+    assert auth._api_key_usage["key-b"] is first
+
+
+def test_failed_usage_flush_keeps_stamps(monkeypatch):
+    """A failed flush leaves the stamps buffered for the next run."""
+    def broken_begin():
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(auth, "db", SimpleNamespace(engine=SimpleNamespace(begin=broken_begin)))
+    auth._record_api_key_use("key-c")
+
+    auth.flush_api_key_usage()
+
+    assert "key-c" in auth._api_key_usage
+
+
+def test_usage_flush_writes_stamps():
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SQLALCHEMY_ENGINE_OPTIONS={"poolclass": StaticPool, "connect_args": {"check_same_thread": False}},
+    )
+    db.init_app(app)
+    with app.app_context():
+        with db.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE api_keys (key TEXT PRIMARY KEY, last_used_at TIMESTAMP)"))
+            conn.execute(text("INSERT INTO api_keys (key) VALUES ('key-flush')"))
+        auth._record_api_key_use("key-flush")
+
+        auth.flush_api_key_usage()
+
+        assert not auth._api_key_usage
+        with db.engine.connect() as conn:
+            assert conn.execute(text("SELECT last_used_at FROM api_keys")).scalar() is not None
+
+
+def test_usage_flusher_starts_once_per_process(monkeypatch):
+    """Each forked worker starts its own flusher, but only once."""
+    started, at_exit = [], []
+
+    class FakeThread:
+        def __init__(self, target, args, name, daemon):
+            self.args = args
+
+        def start(self):
+            started.append(self.args)
+
+    monkeypatch.setattr(auth.threading, "Thread", FakeThread)
+    monkeypatch.setattr(auth.atexit, "register", lambda fn, *args: at_exit.append(fn))
+    monkeypatch.setattr(auth, "_usage_flusher_pid", os.getpid() + 1)  # as if inherited across fork
+    app = Flask(__name__)
+
+    with app.app_context():
+        auth._ensure_usage_flusher()
+        auth._ensure_usage_flusher()
+
+    assert started == [(app,)]
+    assert at_exit == [auth._flush_in_context]
+    assert auth._usage_flusher_pid == os.getpid()
@@ -0,0 +1,113 @@
+"""
+Tests for the minting transaction in peoples_coin.systems.circulatory_system.
+"""
+import uuid
+
+import pytest
+from flask import Flask
+from sqlalchemy import select, text
+from sqlalchemy.pool import StaticPool
+
+from peoples_coin.extensions import db
+from peoples_coin.models import GoodwillAction, LedgerEntry, UserAccount
+from peoples_coin.systems.circulatory_system import CirculatorySystem
+
+# Only the columns minting touches; the real schema uses Postgres-only types.
+SCHEMA = (
+    "CREATE TABLE user_accounts (id CHAR(32) PRIMARY KEY, balance NUMERIC NOT NULL DEFAULT 0, updated_at TIMESTAMP)",
+    "CREATE TABLE user_wallets (id CHAR(32) PRIMARY KEY, user_id CHAR(32), public_address TEXT, is_primary BOOLEAN)",
+    "CREATE TABLE goodwill_actions (id CHAR(32) PRIMARY KEY, performer_user_id CHAR(32), status TEXT,"
+    " loves_value INTEGER, updated_at TIMESTAMP)",
+    "CREATE TABLE chain_blocks (height INTEGER)",
+    "CREATE TABLE ledger_entries (id CHAR(32) PRIMARY KEY, blockchain_tx_hash TEXT, goodwill_action_id CHAR(32),"
+    " transaction_type TEXT, amount NUMERIC, token_symbol TEXT, sender_address TEXT, receiver_address TEXT,"
+    " block_number INTEGER, block_timestamp TIMESTAMP, status TEXT, meta_data TEXT DEFAULT '{}',"
+    " initiator_user_id CHAR(32), receiver_user_id CHAR(32), created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)",
+)
+
+
+class FakeConsensus:
+    def __init__(self):
+        self.queued = []
+
+    def next_block_number(self, session):
+        return 1
+
+    def queue_transaction(self, transaction):
+        self.queued.append(transaction)
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SQLALCHEMY_ENGINE_OPTIONS={"poolclass": StaticPool, "connect_args": {"check_same_thread": False}},
+    )
+    db.init_app(app)
+    with app.app_context():
+        with db.engine.begin() as conn:
+            for statement in SCHEMA:
+                conn.execute(text(statement))
+        yield app
+
+
+@pytest.fixture
+def minter(app):
+    system = CirculatorySystem()
+    system.app = app
+    system.db = db
+    system.consensus = FakeConsensus()
+    system.minter_wallet_address = "0xminter"
+    system._initialized = True
+    return system
+
+
+@pytest.fixture
+def action_id(app):
+    user_id, action_id = uuid.uuid4(), uuid.uuid4()
+    with db.engine.begin() as conn:
+        conn.execute(text("INSERT INTO user_accounts (id, balance) VALUES (:id, 0)"), {"id": user_id.hex})
+        conn.execute(
+            text("INSERT INTO user_wallets VALUES (:id, :user_id, '0xuser', 1)"),
+            {"id": uuid.uuid4().hex, "user_id": user_id.hex},
+        )
+        conn.execute(
+            text("INSERT INTO goodwill_actions VALUES (:id, :user_id, 'VERIFIED', 5, NULL)"),
+            {"id": action_id.hex, "user_id": user_id.hex},
+        )
+    return action_id
+
+
+def _status(action_id):
+    with db.engine.connect() as conn:
+        return conn.execute(select(GoodwillAction.status).where(GoodwillAction.id == action_id)).scalar()
+
+
+def test_mint_claims_credits_and_queues(minter, action_id):
+    ok, _, _ = minter.process_goodwill_for_minting(action_id)
+
+    assert ok
+    assert _status(action_id) == "ISSUED_ON_CHAIN"
+    with db.engine.connect() as conn:
+        assert conn.execute(select(UserAccount.balance)).scalar() == 5
+        assert conn.execute(select(LedgerEntry.goodwill_action_id)).scalar() == action_id
+    assert minter.consensus.queued == [{"action_id": str(action_id), "amount": 5.0}]
+
+    ok, msg, _ = minter.process_goodwill_for_minting(action_id)
+    assert ok and "already issued" in msg
+    assert len(minter.consensus.queued) == 1
+
+
+def test_failed_ledger_insert_releases_the_claim(minter, action_id):
+    """A failure after the claim must leave the action VERIFIED, uncredited and unqueued."""
+    with db.engine.begin() as conn:
+        conn.execute(text("DROP TABLE ledger_entries"))
+
+    ok, _, _ = minter.process_goodwill_for_minting(action_id)
+
+    assert not ok
+    assert _status(action_id) == "VERIFIED"
+    with db.engine.connect() as conn:
+        assert conn.execute(select(UserAccount.balance)).scalar() == 0
+    assert minter.consensus.queued == []
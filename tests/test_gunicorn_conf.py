@@ -0,0 +1,75 @@
+"""
+Tests for the post_fork hook in gunicorn.conf.py.
+"""
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from peoples_coin.extensions import db
+from peoples_coin.systems.system_controller import controller_system
+
+CONF_PATH = Path(__file__).resolve().parent.parent / "gunicorn.conf.py"
+
+
+def _load_conf():
+    # Each load is a fresh module, standing in for a freshly forked worker.
+    spec = importlib.util.spec_from_file_location("gunicorn_conf", CONF_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+    return app
+
+
+@pytest.fixture
+def started(monkeypatch):
+    calls = []
+    monkeypatch.setattr(controller_system, "init_app", lambda app, redis_instance=None: None)
+    monkeypatch.setattr(controller_system, "start", lambda: calls.append("start"))
+    monkeypatch.setattr("atexit.register", lambda fn, *args: None)
+    return calls
+
+
+def _worker(app):
+    return SimpleNamespace(pid=1234, app=SimpleNamespace(wsgi=lambda: app))
+
+
+def test_controller_starts_in_one_worker_only(app, started, tmp_path):
+    app.config["ENABLE_CONTROLLER"] = True
+    workers = [_load_conf(), _load_conf()]
+    for conf in workers:
+        conf.CONTROLLER_LOCK_PATH = str(tmp_path / "controller.lock")
+        conf.post_fork(server=None, worker=_worker(app))
+
+    assert started == ["start"]
+
+
+def test_controller_stays_off_by_default(app, started, tmp_path):
+    conf = _load_conf()
+    conf.CONTROLLER_LOCK_PATH = str(tmp_path / "controller.lock")
+
+    conf.post_fork(server=None, worker=_worker(app))
+
+    assert started == []
+    assert conf._controller_lock is None
+
+
+def test_every_worker_resets_inherited_pool(app, started, monkeypatch, tmp_path):
+    disposed = []
+    with app.app_context():
+        monkeypatch.setattr(db.engine, "dispose", lambda close=True: disposed.append(close))
+
+    for conf in (_load_conf(), _load_conf()):
+        conf.CONTROLLER_LOCK_PATH = str(tmp_path / "controller.lock")
+        conf.post_fork(server=None, worker=_worker(app))
+
+    assert disposed == [False, False]
@@ -0,0 +1,25 @@
+"""
+Tests for the /metrics endpoint in peoples_coin.utils.metrics.
+"""
+from flask import Flask
+
+from peoples_coin.utils import metrics
+
+
+def test_metrics_endpoint_requires_api_key():
+    app = Flask(__name__)
+    metrics.init_metrics(app)
+
+    response = app.test_client().get("/metrics")
+
+    assert response.status_code == 401
+
+
+def test_collect_uses_shared_dir_when_multiprocess(monkeypatch, tmp_path):
+    """With PROMETHEUS_MULTIPROC_DIR set, /metrics reads the workers' shared files, not this process's registry."""
+    with metrics.observe_latency("in_process_op"):
+        pass
+    assert b"in_process_op" in metrics._collect()
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    assert b"in_process_op" not in metrics._collect()
@@ -0,0 +1,44 @@
+"""
+Tests for the reCAPTCHA replay guard in peoples_coin.utils.recaptcha.
+"""
+import pytest
+import requests
+
+from peoples_coin.utils import recaptcha
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"tokenProperties": {"valid": True}, "riskAnalysis": {"score": 0.9}}
+
+
+@pytest.fixture(autouse=True)
+def configured(monkeypatch):
+    monkeypatch.setattr(recaptcha, "RECAPTCHA_CONFIGURED", True)
+    monkeypatch.setattr(recaptcha, "RECAPTCHA_ASSESSMENT_URL", "https://recaptcha.invalid/assess")
+    recaptcha._seen_tokens.clear()
+    yield
+    recaptcha._seen_tokens.clear()
+
+
+def test_replayed_token_is_rejected_without_network(monkeypatch):
+    calls = []
+    monkeypatch.setattr(recaptcha._http_session, "post", lambda *a, **kw: calls.append(a) or FakeResponse())
+
+    assert recaptcha.verify_recaptcha("token-1", "login")[0]
+    assert not recaptcha.verify_recaptcha("token-1", "login")[0]
+    assert len(calls) == 1
+
+
+def test_connection_failure_leaves_token_retryable(monkeypatch):
+    def fail(*args, **kwargs):
+        raise requests.ConnectionError("unreachable")
+
+    monkeypatch.setattr(recaptcha._http_session, "post", fail)
+    assert not recaptcha.verify_recaptcha("token-2", "login")[0]
+
+    monkeypatch.setattr(recaptcha._http_session, "post", lambda *a, **kw: FakeResponse())
+    assert recaptcha.verify_recaptcha("token-2", "login")[0]
@@ -0,0 +1,73 @@
+"""
+Tests for a SystemController cycle run the way create_app wires it.
+"""
+import json
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from peoples_coin.extensions import db
+from peoples_coin.systems.system_controller import PENDING_ACTIONS_CACHE_KEY, SystemController
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = str(value).encode()
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SQLALCHEMY_ENGINE_OPTIONS={"poolclass": StaticPool, "connect_args": {"check_same_thread": False}},
+        CONTROLLER_BACKLOG_THRESHOLD=1,
+        CONTROLLER_LOG_FLUSH_EVERY=1,
+    )
+    db.init_app(app)
+    with app.app_context():
+        with db.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE goodwill_actions (id INTEGER PRIMARY KEY, status TEXT)"))
+            conn.execute(text(
+                "CREATE TABLE controller_actions (id INTEGER PRIMARY KEY, timestamp TIMESTAMP,"
+                " user_id CHAR(32), recommendations TEXT, actions_taken TEXT)"
+            ))
+            conn.execute(text("INSERT INTO goodwill_actions (status) VALUES ('PENDING_VERIFICATION'), ('PENDING_VERIFICATION')"))
+    return app
+
+
+def test_cycle_caches_metrics_and_logs_actions(app):
+    redis = FakeRedis()
+    controller = SystemController()
+    controller.init_app(app, redis_instance=redis)
+
+    controller.run_cycle()
+
+    assert redis.store[PENDING_ACTIONS_CACHE_KEY] == b"2"
+    with app.app_context(), db.engine.connect() as conn:
+        rows = conn.execute(text("SELECT recommendations, actions_taken FROM controller_actions")).all()
+    assert len(rows) == 1
+    assert "scale_up" in json.loads(rows[0].recommendations)
+    assert json.loads(rows[0].actions_taken) == ["Scale-up triggered."]
+
+
+def test_cycle_reads_cached_backlog(app):
+    redis = FakeRedis()
+    redis.store[PENDING_ACTIONS_CACHE_KEY] = b"0"
+    controller = SystemController()
+    controller.init_app(app, redis_instance=redis)
+
+    controller.run_cycle()
+
+    # The cached zero wins over the two pending rows, so nothing is recommended or logged.
+    with app.app_context(), db.engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM controller_actions")).scalar() == 0
+
@@ -0,0 +1,130 @@
+"""
+Tests for peoples_coin.validate.validate_transaction.
+"""
+import json
+from base64 import b64encode
+from datetime import datetime, timezone
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from peoples_coin.validate import validate_transaction as vt
+
+
+def _payload(**overrides):
+    data = {
+        "user_id": "user-1",
+        "action_type": "community_help",
+        "description": "Helped a neighbour",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "loves_value": 5,
+    }
+    data.update(overrides)
+    return data
+
+
+def test_validate_transaction_checks_contributor_whitelist():
+    allowed = lambda: frozenset({"user-1"})
+
+    assert vt.validate_transaction(_payload(), "user-1", allowed).is_valid
+    result = vt.validate_transaction(_payload(user_id="user-2"), "user-2", allowed)
+    assert not result.is_valid
+
+
+def test_naive_timestamp_is_rejected():
+    """Without an offset the instant is ambiguous, even when it matches the server's local clock."""
+    naive = datetime.now().isoformat()
+    result = vt.validate_transaction(_payload(timestamp=naive), "user-1", lambda: frozenset({"user-1"}))
+
+    assert not result.is_valid
+    assert [e["loc"] for e in result.errors] == [["timestamp"]]
+
+
+def test_precheck_rejects_before_schema_validation(monkeypatch):
+    """Payloads failing the cheap checks never reach Pydantic."""
+    def fail_validate(*args, **kwargs):
+        raise AssertionError("schema validation should not run")
+
+    monkeypatch.setattr(vt, "_validate_transaction_model", fail_validate)
+    allowed = lambda: frozenset({"user-1"})
+
+    assert not vt.validate_transaction(["not", "a", "dict"], "user-1", allowed).is_valid
+    assert not vt.validate_transaction(_payload(timestamp="x" * 100), "user-1", allowed).is_valid
+    assert not vt.validate_transaction(_payload(), "someone-else", allowed).is_valid
+
+
+def _reference_message(model):
+    """The documented canonical form: sorted-key compact json.dumps of the signed fields."""
+    payload = {
+        "user_id": model.user_id,
+        "action_type": model.action_type,
+        "description": model.description,
+        "timestamp": model.timestamp.isoformat().replace("+00:00", "Z"),
+        "loves_value": model.loves_value,
+        "contextual_data": model.contextual_data,
+    }
+    if model.correlation_id:
+        payload["correlation_id"] = model.correlation_id
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def test_signed_message_matches_canonical_json():
+    for overrides in (
+        {},
+        {"correlation_id": "corr-1"},
+        {"description": 'Café "quoted" ☃', "contextual_data": {"b": [1, 2.5], "a": {"z": None, "y": "é"}}},
+    ):
+        model = vt.TransactionModel.model_validate(_payload(**overrides))
+        assert vt._signed_message(model) == _reference_message(model)
+
+
+def test_signed_high_value_transaction_is_accepted():
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    data = _payload(action_type="treasury_spend", contextual_data={"amount": 10})
+    message = _reference_message(vt.TransactionModel.model_validate(data))
+    signature = b64encode(private_key.sign(message, ec.ECDSA(hashes.SHA256()))).decode()
+    allowed = lambda: frozenset({"user-1"})
+
+    assert vt.validate_transaction(dict(data, signature=signature, public_key_pem=pem), "user-1", allowed).is_valid
+    tampered = dict(data, loves_value=6, signature=signature, public_key_pem=pem)
+    assert not vt.validate_transaction(tampered, "user-1", allowed).is_valid
+
+
+def test_log_sampler_caps_burst_and_counts_suppressed(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(vt.time, "monotonic", lambda: clock[0])
+    sampler = vt._LogSampler(rate=1.0, burst=2)
+
+    assert [sampler.allow(), sampler.allow(), sampler.allow(), sampler.allow()] == [0, 0, None, None]
+    clock[0] += 1.0
+    assert sampler.allow() == 2
+
+
+def test_malformed_signature_inputs_fail_verification():
+    """Bad client keys and signatures are rejected, never raised as internal errors."""
+    ec_pem = ec.generate_private_key(ec.SECP256R1()).public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    rsa_pem = rsa.generate_private_key(public_exponent=65537, key_size=2048).public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+    assert not vt._verify_signature("not a pem", "AAAA", b"{}")
+    assert not vt._verify_signature(ec_pem, "not base64!", b"{}")
+    assert not vt._verify_signature(rsa_pem, "AAAA", b"{}")
+    assert not vt._verify_signature(ec_pem, "AAAA", b"{}")
+
+
+def test_junk_signature_is_rejected_before_key_parsing(monkeypatch):
+    def fail_load(pem):
+        raise AssertionError("public key should not be parsed")
+
+    monkeypatch.setattr(vt, "_load_public_key", fail_load)
+    pem = "-----BEGIN PUBLIC KEY-----\n...\n-----END PUBLIC KEY-----\n"
+
+    assert not vt._verify_signature("garbage", "AAAA", b"{}")
+    assert not vt._verify_signature(pem, "", b"{}")
+    assert not vt._verify_signature(pem, "A" * 400, b"{}")
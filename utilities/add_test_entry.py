@@ -1,16 +1,24 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from peoples_coin.models import Base, DataEntry
+from sqlalchemy import create_engine, text
 from datetime import datetime
 
 engine = create_engine('sqlite:///instance/peoples_coin.db')
-Session = sessionmaker(bind=engine)
-session = Session()
 
-# Create a new unprocessed DataEntry
-entry = DataEntry(value="Test data", processed=False, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+# Core insert straight into the legacy data_entries table: no ORM model or
+# unit-of-work bookkeeping, and any number of rows go in one executemany.
+INSERT_ENTRY = text(
+    "INSERT INTO data_entries (value, processed, created_at, updated_at) "
+    "VALUES (:value, :processed, :created_at, :updated_at)"
+)
 
-session.add(entry)
-session.commit()
-print(f"Inserted DataEntry with id: {entry.id}")
+def insert_entries(values):
+    """Inserts unprocessed data entries for the given values in one transaction."""
+    now = datetime.utcnow()
+    rows = [{"value": v, "processed": False, "created_at": now, "updated_at": now} for v in values]
+    with engine.begin() as conn:
+        conn.execute(INSERT_ENTRY, rows)
+    return len(rows)
 
+if __name__ == "__main__":
+    # Create a new unprocessed data entry
+    insert_entries(["Test data"])
+    print("Inserted DataEntry 'Test data'")
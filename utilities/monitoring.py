@@ -1,35 +1,49 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from flask import Blueprint, jsonify
 
 monitor_bp = Blueprint('monitor_bp', __name__)
 
-# Define subsystems and their status endpoints
-SUBSYSTEMS = {
+# Define subsystems and their status endpoints, frozen into (name, url) pairs
+# so the probe threads share an immutable table.
+SUBSYSTEMS = tuple({
     "cognitive_system": f"http://localhost:{os.getenv('COGNITIVE_PORT', 5003)}/cognitive/status",
     "skeleton_system": f"http://localhost:{os.getenv('SKELETON_PORT', 5002)}/status",
     "nervous_system": f"http://localhost:{os.getenv('NERVOUS_PORT', 5001)}/status",
     "immune_system": f"http://localhost:{os.getenv('IMMUNE_PORT', 5004)}/status",  # New immune system
     # Future systems can be added here
     # "future_system": f"http://localhost:{os.getenv('FUTURE_PORT', 5005)}/status",
-}
+}.items())
+
+# Probes are independent, so run them side by side: a /health call takes as
+# long as the slowest subsystem rather than the sum of all of them.
+_probe_executor = ThreadPoolExecutor(max_workers=len(SUBSYSTEMS), thread_name_prefix="health-probe")
+
+# Shared session: each subsystem keeps a warm keep-alive connection across polls.
+_probe_session = requests.Session()
+_probe_session.mount(
+    "http://", HTTPAdapter(pool_connections=len(SUBSYSTEMS), pool_maxsize=len(SUBSYSTEMS))
+)
+
+def _probe(url):
+    """Fetches one subsystem's status endpoint and summarizes the outcome."""
+    try:
+        resp = _probe_session.get(url, timeout=2)
+        if resp.status_code == 200:
+            try:
+                detail = resp.json()
+            except Exception:
+                detail = resp.text
+            return {"status": "ok", "detail": detail}
+        return {"status": "error", "detail": f"HTTP {resp.status_code}"}
+    except Exception as e:
+        return {"status": "unreachable", "detail": str(e)}
 
 @monitor_bp.route("/health", methods=["GET"])
 def health_check():
-    results = {}
-    for name, url in SUBSYSTEMS.items():
-        try:
-            resp = requests.get(url, timeout=2)
-            if resp.status_code == 200:
-                try:
-                    detail = resp.json()
-                except Exception:
-                    detail = resp.text
-                results[name] = {"status": "ok", "detail": detail}
-            else:
-                results[name] = {"status": "error", "detail": f"HTTP {resp.status_code}"}
-        except Exception as e:
-            results[name] = {"status": "unreachable", "detail": str(e)}
-
+    futures = {name: _probe_executor.submit(_probe, url) for name, url in SUBSYSTEMS}
+    results = {name: future.result() for name, future in futures.items()}
     return jsonify(results)
-
@@ -1,5 +1,7 @@
 import logging
+from sqlalchemy import text
 from peoples_coin.factory import create_app
+from peoples_coin.extensions import db
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -12,3 +14,17 @@ try:
 except Exception as e:
     logger.exception("🚨 CRITICAL FAILURE in wsgi.py: %s", str(e))
     raise
+
+# Gunicorn runs with --preload, so this module is imported once in the master
+# and forked into the workers. Run one query here so dialect initialization is
+# done before fork and shared copy-on-write, then close the warm-up connection
+# so the master holds none. Each worker still resets its own pool in the
+# post_fork hook in gunicorn.conf.py.
+with app.app_context():
+    try:
+        with db.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        logger.info("✅ Database engine warmed before worker fork.")
+    except Exception as e:
+        logger.warning("⚠️ Database warm-up skipped: %s", e)
+    db.engine.dispose()